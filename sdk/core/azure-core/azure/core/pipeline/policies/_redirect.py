@@ -55,6 +55,11 @@ ClsRedirectPolicy = TypeVar("ClsRedirectPolicy", bound="RedirectPolicyBase")
 
 _LOGGER = logging.getLogger(__name__)
 
+_LOCATION_HEADER = "location"
+# 301/302 are only followed for safe methods; other redirect statuses are followed for any method
+_SAFE_METHOD_REDIRECT_STATUSES = frozenset([301, 302])
+_SAFE_REDIRECT_METHODS = frozenset(["GET", "HEAD"])
+
 
 def domain_changed(original_domain: Optional[str], url: str) -> bool:
     """Checks if the domain has changed.
@@ -72,6 +77,29 @@ def domain_changed(original_domain: Optional[str], url: str) -> bool:
     return True
 
 
+def _domain_changed_fast(
+    original_domain: Optional[str], redirect_location: str, url: str, left_original_domain: bool
+) -> bool:
+    """Checks if following a redirect moved the request to a different domain.
+
+    A location without a network location (no "//") is resolved against the current
+    host, so while the request is still on the original domain the redirected url
+    only needs to be parsed for absolute locations.
+
+    :param str original_domain: The original domain, as returned by ``get_domain``.
+    :param str redirect_location: The location the response redirected to.
+    :param str url: The url of the redirected request.
+    :param bool left_original_domain: Whether an earlier redirect moved the request off the original domain.
+    :rtype: bool
+    :return: Whether the domain has changed.
+    """
+    if not original_domain:
+        return False
+    if not left_original_domain and "//" not in redirect_location:
+        return False
+    return get_domain(url) != original_domain
+
+
 class RedirectPolicyBase:
 
     REDIRECT_STATUSES = frozenset([300, 301, 302, 303, 307, 308])
@@ -123,15 +151,14 @@ class RedirectPolicyBase:
          location. ``False`` if not a redirect status code.
         :rtype: str or bool or None
         """
-        if response.http_response.status_code in [301, 302]:
-            if response.http_request.method in [
-                "GET",
-                "HEAD",
-            ]:
-                return response.http_response.headers.get("location")
+        http_response = response.http_response
+        status_code = http_response.status_code
+        if status_code in _SAFE_METHOD_REDIRECT_STATUSES:
+            if response.http_request.method in _SAFE_REDIRECT_METHODS:
+                return http_response.headers.get(_LOCATION_HEADER)
             return False
-        if response.http_response.status_code in self._redirect_on_status_codes:
-            return response.http_response.headers.get("location")
+        if status_code in self._redirect_on_status_codes:
+            return http_response.headers.get(_LOCATION_HEADER)
 
         return False
 
@@ -198,22 +225,32 @@ class RedirectPolicy(RedirectPolicyBase, HTTPPolicy[HTTPRequestType, HTTPRespons
         :rtype: ~azure.core.pipeline.PipelineResponse
         :raises ~azure.core.exceptions.TooManyRedirectsError: if maximum redirects exceeded.
         """
-        retryable: bool = True
-        redirect_settings = self.configure_redirects(request.context.options)
-        original_domain = get_domain(request.http_request.url) if redirect_settings["allow"] else None
-        while retryable:
-            response = self.next.send(request)
-            redirect_location = self.get_redirect_location(response)
-            if redirect_location and redirect_settings["allow"]:
-                retryable = self.increment(redirect_settings, response, redirect_location)
+        options = request.context.options
+        redirect_settings = self.configure_redirects(options)
+        if not redirect_settings["allow"]:
+            return self.next.send(request)
+        original_domain = get_domain(request.http_request.url)
+        next_send = self.next.send
+        get_redirect_location = self.get_redirect_location
+        increment = self.increment
+        left_original_domain = False
+        for _ in range(max(redirect_settings["redirects"], 0) + 1):
+            response = next_send(request)
+            redirect_location = get_redirect_location(response)
+            if not redirect_location:
+                return response
+            if not increment(redirect_settings, response, redirect_location):
+                break
+            if request.http_request is not response.http_request:
                 request.http_request = response.http_request
-                if domain_changed(original_domain, request.http_request.url):
-                    # "insecure_domain_change" is used to indicate that a redirect
-                    # has occurred to a different domain. This tells the SensitiveHeaderCleanupPolicy
-                    # to clean up sensitive headers. We need to remove it before sending the request
-                    # to the transport layer.
-                    request.context.options["insecure_domain_change"] = True
-                continue
-            return response
+            left_original_domain = _domain_changed_fast(
+                original_domain, redirect_location, request.http_request.url, left_original_domain
+            )
+            if left_original_domain:
+                # "insecure_domain_change" is used to indicate that a redirect
+                # has occurred to a different domain. This tells the SensitiveHeaderCleanupPolicy
+                # to clean up sensitive headers. We need to remove it before sending the request
+                # to the transport layer.
+                options["insecure_domain_change"] = True
 
         raise TooManyRedirectsError(redirect_settings["history"])
@@ -32,7 +32,7 @@ from azure.core.pipeline.transport import (
 )
 from azure.core.rest import AsyncHttpResponse, HttpRequest
 from . import AsyncHTTPPolicy
-from ._redirect import RedirectPolicyBase, domain_changed
+from ._redirect import RedirectPolicyBase, _domain_changed_fast
 from ._utils import get_domain
 
 AsyncHTTPResponseType = TypeVar("AsyncHTTPResponseType", AsyncHttpResponse, LegacyAsyncHttpResponse)
@@ -69,22 +69,32 @@ class AsyncRedirectPolicy(RedirectPolicyBase, AsyncHTTPPolicy[HTTPRequestType, A
         :rtype: ~azure.core.pipeline.PipelineResponse
         :raises ~azure.core.exceptions.TooManyRedirectsError: if maximum redirects exceeded.
         """
-        redirects_remaining = True
-        redirect_settings = self.configure_redirects(request.context.options)
-        original_domain = get_domain(request.http_request.url) if redirect_settings["allow"] else None
-        while redirects_remaining:
-            response = await self.next.send(request)
-            redirect_location = self.get_redirect_location(response)
-            if redirect_location and redirect_settings["allow"]:
-                redirects_remaining = self.increment(redirect_settings, response, redirect_location)
+        options = request.context.options
+        redirect_settings = self.configure_redirects(options)
+        if not redirect_settings["allow"]:
+            return await self.next.send(request)
+        original_domain = get_domain(request.http_request.url)
+        next_send = self.next.send
+        get_redirect_location = self.get_redirect_location
+        increment = self.increment
+        left_original_domain = False
+        for _ in range(max(redirect_settings["redirects"], 0) + 1):
+            response = await next_send(request)
+            redirect_location = get_redirect_location(response)
+            if not redirect_location:
+                return response
+            if not increment(redirect_settings, response, redirect_location):
+                break
+            if request.http_request is not response.http_request:
                 request.http_request = response.http_request
-                if domain_changed(original_domain, request.http_request.url):
-                    # "insecure_domain_change" is used to indicate that a redirect
-                    # has occurred to a different domain. This tells the SensitiveHeaderCleanupPolicy
-                    # to clean up sensitive headers. We need to remove it before sending the request
-                    # to the transport layer.
-                    request.context.options["insecure_domain_change"] = True
-                continue
-            return response
+            left_original_domain = _domain_changed_fast(
+                original_domain, redirect_location, request.http_request.url, left_original_domain
+            )
+            if left_original_domain:
+                # "insecure_domain_change" is used to indicate that a redirect
+                # has occurred to a different domain. This tells the SensitiveHeaderCleanupPolicy
+                # to clean up sensitive headers. We need to remove it before sending the request
+                # to the transport layer.
+                options["insecure_domain_change"] = True
 
         raise TooManyRedirectsError(redirect_settings["history"])
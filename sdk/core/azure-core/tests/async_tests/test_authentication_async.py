@@ -476,6 +476,59 @@ async def test_bearer_policy_redirect_different_domain():
     await pipeline.run(HttpRequest("GET", "https://localhost"))
 
 
+@pytest.mark.asyncio
+async def test_bearer_policy_redirect_different_domain_then_relative():
+    """A relative redirect after a cross-domain redirect stays on the other domain, so the token mustn't be sent"""
+
+    class MockTransport(AsyncHttpTransport):
+        def __init__(self):
+            self.requests = []
+
+        async def __aexit__(self, exc_type, exc_val, exc_tb):
+            pass
+
+        async def close(self):
+            pass
+
+        async def open(self):
+            pass
+
+        async def send(self, request, **kwargs):  # type: (PipelineRequest, Any) -> PipelineResponse
+            self.requests.append((request.url, request.headers.get("Authorization")))
+            response = Response()
+            if len(self.requests) == 1:
+                response.status_code = 307
+                response.headers["location"] = "https://localhost1/a"
+            elif len(self.requests) == 2:
+                response.status_code = 307
+                response.headers["location"] = "/b"
+            else:
+                response.status_code = 200
+            return response
+
+    auth_headder = "token"
+    expected_scope = "scope"
+
+    async def get_token(*_, **__):
+        token = AccessToken(auth_headder, 0)
+        return token
+
+    credential = Mock(spec_set=["get_token"], get_token=get_token)
+    auth_policy = AsyncBearerTokenCredentialPolicy(credential, expected_scope)
+    redirect_policy = AsyncRedirectPolicy()
+    header_clean_up_policy = SensitiveHeaderCleanupPolicy()
+    transport = MockTransport()
+    pipeline = AsyncPipeline(transport=transport, policies=[redirect_policy, auth_policy, header_clean_up_policy])
+
+    await pipeline.run(HttpRequest("GET", "https://localhost"))
+
+    assert transport.requests == [
+        ("https://localhost", "Bearer {}".format(auth_headder)),
+        ("https://localhost1/a", None),
+        ("https://localhost1/b", None),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_bearer_policy_redirect_opt_out_clean_up():
     class MockTransport(AsyncHttpTransport):
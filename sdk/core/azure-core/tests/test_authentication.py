@@ -674,6 +674,54 @@ def test_bearer_policy_redirect_different_domain():
     pipeline.run(HttpRequest("GET", "https://localhost"))
 
 
+def test_bearer_policy_redirect_different_domain_then_relative():
+    """A relative redirect after a cross-domain redirect stays on the other domain, so the token mustn't be sent"""
+
+    class MockTransport(HttpTransport):
+        def __init__(self):
+            self.requests = []
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            pass
+
+        def close(self):
+            pass
+
+        def open(self):
+            pass
+
+        def send(self, request, **kwargs):  # type: (PipelineRequest, Any) -> PipelineResponse
+            self.requests.append((request.url, request.headers.get("Authorization")))
+            response = Response()
+            if len(self.requests) == 1:
+                response.status_code = 307
+                response.headers["location"] = "https://localhost1/a"
+            elif len(self.requests) == 2:
+                response.status_code = 307
+                response.headers["location"] = "/b"
+            else:
+                response.status_code = 200
+            return response
+
+    auth_headder = "token"
+    expected_scope = "scope"
+    token = AccessToken(auth_headder, 0)
+    credential = Mock(spec_set=["get_token"], get_token=Mock(return_value=token))
+    auth_policy = BearerTokenCredentialPolicy(credential, expected_scope)
+    redirect_policy = RedirectPolicy()
+    header_clean_up_policy = SensitiveHeaderCleanupPolicy()
+    transport = MockTransport()
+    pipeline = Pipeline(transport=transport, policies=[redirect_policy, auth_policy, header_clean_up_policy])
+
+    pipeline.run(HttpRequest("GET", "https://localhost"))
+
+    assert transport.requests == [
+        ("https://localhost", "Bearer {}".format(auth_headder)),
+        ("https://localhost1/a", None),
+        ("https://localhost1/b", None),
+    ]
+
+
 def test_bearer_policy_redirect_opt_out_clean_up():
     class MockTransport(HttpTransport):
         def __init__(self):
@@ -2,10 +2,15 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # ---------------------------------------------------------
 from enum import Enum
-from typing import List
+from typing import FrozenSet, List, Tuple
 
-class AttackStrategy(Enum):
-    """Strategies for attacks."""
+class AttackStrategy(str, Enum):
+    """Strategies for attacks.
+
+    Members are also ``str`` instances equal to their values, and format as their values
+    on every supported Python, so they can be passed directly wherever a strategy string
+    is expected.
+    """
     EASY = "easy"
     MODERATE = "moderate"
     DIFFICULT = "difficult"
@@ -39,11 +44,24 @@ class AttackStrategy(Enum):
     Baseline = "baseline"
     Jailbreak = "jailbreak"
 
+    # like StrEnum (Python 3.11+), which str-and-Enum mixins don't match: they format as the
+    # member name on 3.11+ and as the value with format() only on earlier versions
+    __str__ = str.__str__
+    __format__ = str.__format__
+
     @classmethod
-    def Compose(cls, items: List["AttackStrategy"]) -> List["AttackStrategy"]:
-        for item in items:
-            if not isinstance(item, cls):
-                raise ValueError("All items must be instances of AttackStrategy")
-        if len(items) > 2: 
+    def Compose(cls, items: List["AttackStrategy"]) -> Tuple["AttackStrategy", ...]:
+        if len(items) > 2:
             raise ValueError("Composed strategies must have at most 2 items")
-        return items
\ No newline at end of file
+        if all(item.__class__ is cls for item in items):
+            return tuple(items)
+        try:
+            valid = _MEMBERS.issuperset(items)
+        except TypeError:  # unhashable items cannot be members
+            valid = False
+        if not valid:
+            raise ValueError("All items must be instances of AttackStrategy")
+        return tuple(cls(item) for item in items)
+
+
+_MEMBERS: FrozenSet[AttackStrategy] = frozenset(AttackStrategy.__members__.values())
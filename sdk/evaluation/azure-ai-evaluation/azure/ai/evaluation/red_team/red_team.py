@@ -10,7 +10,7 @@ import logging
 import tempfile
 import time
 from datetime import datetime
-from typing import Callable, Dict, List, Optional, Union, cast
+from typing import Callable, Dict, List, Optional, Sequence, Union, cast
 import json
 from pathlib import Path
 import itertools
@@ -570,17 +570,17 @@ class RedTeam():
         return message_to_dict(message)
     
     # Replace with utility function
-    def _get_strategy_name(self, attack_strategy: Union[AttackStrategy, List[AttackStrategy]]) -> str:
+    def _get_strategy_name(self, attack_strategy: Union[AttackStrategy, Sequence[AttackStrategy]]) -> str:
         from .utils.formatting_utils import get_strategy_name
         return get_strategy_name(attack_strategy)
 
     # Replace with utility function
-    def _get_flattened_attack_strategies(self, attack_strategies: List[Union[AttackStrategy, List[AttackStrategy]]]) -> List[Union[AttackStrategy, List[AttackStrategy]]]:
+    def _get_flattened_attack_strategies(self, attack_strategies: List[Union[AttackStrategy, Sequence[AttackStrategy]]]) -> List[Union[AttackStrategy, List[AttackStrategy]]]:
         from .utils.formatting_utils import get_flattened_attack_strategies
         return get_flattened_attack_strategies(attack_strategies)
     
     # Replace with utility function
-    def _get_converter_for_strategy(self, attack_strategy: Union[AttackStrategy, List[AttackStrategy]]) -> Union[PromptConverter, List[PromptConverter]]:
+    def _get_converter_for_strategy(self, attack_strategy: Union[AttackStrategy, Sequence[AttackStrategy]]) -> Union[PromptConverter, List[PromptConverter]]:
         from .utils.strategy_utils import get_converter_for_strategy
         return get_converter_for_strategy(attack_strategy)
 
@@ -755,7 +755,7 @@ class RedTeam():
         return get_chat_target(target)
     
     # Replace with utility function
-    def _get_orchestrators_for_attack_strategies(self, attack_strategy: List[Union[AttackStrategy, List[AttackStrategy]]]) -> List[Callable]:
+    def _get_orchestrators_for_attack_strategies(self, attack_strategy: List[Union[AttackStrategy, Sequence[AttackStrategy]]]) -> List[Callable]:
         # We need to modify this to use our actual _prompt_sending_orchestrator since the utility function can't access it
         call_to_orchestrators = []
         # Sending PromptSendingOrchestrator for each complexity level
@@ -1111,7 +1111,7 @@ class RedTeam():
         self,
         data_path: Union[str, os.PathLike],
         risk_category: RiskCategory,
-        strategy: Union[AttackStrategy, List[AttackStrategy]],
+        strategy: Union[AttackStrategy, Sequence[AttackStrategy]],
         scan_name: Optional[str] = None,
         data_only: bool = False,
         output_path: Optional[Union[str, os.PathLike]] = None
@@ -1261,7 +1261,7 @@ class RedTeam():
             self, 
             target: Union[Callable, AzureOpenAIModelConfiguration, OpenAIModelConfiguration],
             call_orchestrator: Callable, 
-            strategy: Union[AttackStrategy, List[AttackStrategy]],
+            strategy: Union[AttackStrategy, Sequence[AttackStrategy]],
             risk_category: RiskCategory,
             all_prompts: List[str],
             progress_bar: tqdm,
@@ -1369,7 +1369,7 @@ class RedTeam():
             target: Union[Callable, AzureOpenAIModelConfiguration, OpenAIModelConfiguration, PromptChatTarget],
             scan_name: Optional[str] = None,
             num_turns : int = 1,
-            attack_strategies: List[Union[AttackStrategy, List[AttackStrategy]]] = [],
+            attack_strategies: List[Union[AttackStrategy, Sequence[AttackStrategy]]] = [],
             data_only: bool = False, 
             output_path: Optional[Union[str, os.PathLike]] = None,
             application_scenario: Optional[str] = None,
@@ -1386,7 +1386,7 @@ class RedTeam():
         :param num_turns: Number of conversation turns to use in the scan
         :type num_turns: int
         :param attack_strategies: List of attack strategies to use
-        :type attack_strategies: List[Union[AttackStrategy, List[AttackStrategy]]]
+        :type attack_strategies: List[Union[AttackStrategy, Sequence[AttackStrategy]]]
         :param data_only: Whether to return only data without evaluation
         :type data_only: bool
         :param output_path: Optional path for output
@@ -1510,7 +1510,7 @@ class RedTeam():
             strategies_to_remove = []
             
             for i, strategy in enumerate(attack_strategies):
-                if isinstance(strategy, list):
+                if isinstance(strategy, (list, tuple)):
                     # Skip composite strategies for now
                     continue
                     
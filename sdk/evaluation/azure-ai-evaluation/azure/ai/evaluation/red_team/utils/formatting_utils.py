@@ -6,7 +6,7 @@ import json
 import pandas as pd
 import math
 from datetime import datetime
-from typing import Dict, List, Union, Any, Optional, cast
+from typing import Dict, List, Sequence, Union, Any, Optional, cast
 from ..attack_strategy import AttackStrategy
 from ..red_team_result import RedTeamResult
 from pyrit.models import ChatMessage
@@ -26,25 +26,25 @@ def message_to_dict(message: ChatMessage) -> Dict[str, str]:
     }
 
 
-def get_strategy_name(attack_strategy: Union[AttackStrategy, List[AttackStrategy]]) -> str:
+def get_strategy_name(attack_strategy: Union[AttackStrategy, Sequence[AttackStrategy]]) -> str:
     """Get a string name for an attack strategy or list of strategies.
     
     :param attack_strategy: The attack strategy or list of strategies
-    :type attack_strategy: Union[AttackStrategy, List[AttackStrategy]]
+    :type attack_strategy: Union[AttackStrategy, Sequence[AttackStrategy]]
     :return: A string name for the strategy
     :rtype: str
     """
-    if isinstance(attack_strategy, List):
+    if isinstance(attack_strategy, (list, tuple)):
         return "_".join([str(strategy.value) for strategy in attack_strategy])
     else:
         return str(attack_strategy.value)
 
 
-def get_flattened_attack_strategies(attack_strategies: List[Union[AttackStrategy, List[AttackStrategy]]]) -> List[Union[AttackStrategy, List[AttackStrategy]]]:
+def get_flattened_attack_strategies(attack_strategies: List[Union[AttackStrategy, Sequence[AttackStrategy]]]) -> List[Union[AttackStrategy, List[AttackStrategy]]]:
     """Flatten complex attack strategies into individual strategies.
     
     :param attack_strategies: List of attack strategies to flatten
-    :type attack_strategies: List[Union[AttackStrategy, List[AttackStrategy]]]
+    :type attack_strategies: List[Union[AttackStrategy, Sequence[AttackStrategy]]]
     :return: Flattened list of attack strategies
     :rtype: List[Union[AttackStrategy, List[AttackStrategy]]]
     """
@@ -90,7 +90,7 @@ def get_flattened_attack_strategies(attack_strategies: List[Union[AttackStrategy
     attack_strategies_temp.append(AttackStrategy.Baseline)
 
     for strategy in attack_strategies_temp:
-        if isinstance(strategy, List) and tuple(strategy) not in seen_strategies: # For composed strategies
+        if isinstance(strategy, (list, tuple)) and tuple(strategy) not in seen_strategies: # For composed strategies
             flattened_strategies.append([s for s in strategy])
             seen_strategies.add(tuple(strategy))
         elif isinstance(strategy, AttackStrategy) and strategy not in seen_strategies: # For single strategies
@@ -3,7 +3,7 @@ Utility functions for handling attack strategies and converters in Red Team Agen
 """
 
 import random
-from typing import Dict, List, Union, Optional, Any, Callable, cast
+from typing import Dict, List, Sequence, Union, Optional, Any, Callable, cast
 
 from ..attack_strategy import AttackStrategy
 from pyrit.prompt_converter import (
@@ -69,15 +69,15 @@ def strategy_converter_map() -> Dict[Any, Union[PromptConverter, List[PromptConv
     }
 
 
-def get_converter_for_strategy(attack_strategy: Union[AttackStrategy, List[AttackStrategy]]) -> Union[PromptConverter, List[PromptConverter], None]:
+def get_converter_for_strategy(attack_strategy: Union[AttackStrategy, Sequence[AttackStrategy]]) -> Union[PromptConverter, List[PromptConverter], None]:
     """Get the appropriate converter for a given attack strategy.
     
     :param attack_strategy: The attack strategy or list of strategies
-    :type attack_strategy: Union[AttackStrategy, List[AttackStrategy]]
+    :type attack_strategy: Union[AttackStrategy, Sequence[AttackStrategy]]
     :return: The converter(s) for the strategy
     :rtype: Union[PromptConverter, List[PromptConverter], None]
     """
-    if isinstance(attack_strategy, List):
+    if isinstance(attack_strategy, (list, tuple)):
         return [strategy_converter_map()[strategy] for strategy in attack_strategy]
     else:
         return strategy_converter_map()[attack_strategy]
@@ -171,12 +171,12 @@ def get_chat_target(target: Union[PromptChatTarget, Callable, AzureOpenAIModelCo
     return chat_target
 
 
-def get_orchestrators_for_attack_strategies(attack_strategies: List[Union[AttackStrategy, List[AttackStrategy]]]) -> List[Callable]:
+def get_orchestrators_for_attack_strategies(attack_strategies: List[Union[AttackStrategy, Sequence[AttackStrategy]]]) -> List[Callable]:
     """
     Gets a list of orchestrator functions to use based on the attack strategies.
     
     :param attack_strategies: The list of attack strategies
-    :type attack_strategies: List[Union[AttackStrategy, List[AttackStrategy]]]
+    :type attack_strategies: List[Union[AttackStrategy, Sequence[AttackStrategy]]]
     :return: A list of orchestrator functions
     :rtype: List[Callable]
     """
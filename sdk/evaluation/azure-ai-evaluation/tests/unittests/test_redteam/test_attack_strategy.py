@@ -38,6 +38,13 @@ class TestAttackStrategyEnum:
         for strategy in AttackStrategy:
             assert strategy.value.islower()
 
+    def test_attack_strategy_formats_as_value(self):
+        """Test that AttackStrategy members format as their values, like StrEnum members."""
+        assert AttackStrategy.Base64 == "base64"
+        assert str(AttackStrategy.Base64) == "base64"
+        assert f"{AttackStrategy.Base64}" == "base64"
+        assert "{}".format(AttackStrategy.CharSwap) == "char_swap"
+
 
 @pytest.mark.unittest
 @pytest.mark.skipif(not has_pyrit, reason="redteam extra is not installed")
@@ -47,7 +54,7 @@ class TestAttackStrategyCompose:
     def test_compose_valid(self):
         """Test AttackStrategy.Compose with valid inputs."""
         composed = AttackStrategy.Compose([AttackStrategy.Base64, AttackStrategy.Morse])
-        assert isinstance(composed, list)
+        assert isinstance(composed, tuple)
         assert len(composed) == 2
         assert composed[0] == AttackStrategy.Base64
         assert composed[1] == AttackStrategy.Morse
@@ -55,10 +62,16 @@ class TestAttackStrategyCompose:
     def test_compose_single(self):
         """Test AttackStrategy.Compose with a single strategy."""
         composed = AttackStrategy.Compose([AttackStrategy.Base64])
-        assert isinstance(composed, list)
+        assert isinstance(composed, tuple)
         assert len(composed) == 1
         assert composed[0] == AttackStrategy.Base64
 
+    def test_compose_string_values(self):
+        """Test AttackStrategy.Compose with plain strategy value strings."""
+        composed = AttackStrategy.Compose(["base64", AttackStrategy.Morse])
+        assert composed == (AttackStrategy.Base64, AttackStrategy.Morse)
+        assert all(isinstance(item, AttackStrategy) for item in composed)
+
     def test_compose_invalid_type(self):
         """Test AttackStrategy.Compose with invalid type."""
         with pytest.raises(ValueError) as excinfo:
@@ -78,5 +91,5 @@ class TestAttackStrategyCompose:
     def test_compose_empty(self):
         """Test AttackStrategy.Compose with an empty list."""
         composed = AttackStrategy.Compose([])
-        assert isinstance(composed, list)
-        assert len(composed) == 0
\ No newline at end of file
+        assert isinstance(composed, tuple)
+        assert len(composed) == 0
@@ -10,6 +10,12 @@ An example to show receiving events from an Event Hub with checkpoint store doin
 In the `receive_batch` method of `EventHubConsumerClient`:
 If no partition id is specified, the checkpoint_store are used for load-balance and checkpoint.
 If partition id is specified, the checkpoint_store can only be used for checkpoint without load balancing.
+
+A single credential instance is shared by the checkpoint store and the consumer client so that both use the
+same token cache instead of each acquiring tokens separately.
+
+Installing `uvloop` is optional but recommended on Linux: when available it is used as the event loop,
+which gives higher receive throughput than the default asyncio loop.
 """
 
 import asyncio
@@ -19,6 +25,13 @@ from azure.eventhub.aio import EventHubConsumerClient
 from azure.eventhub.extensions.checkpointstoreblobaio import BlobCheckpointStore
 from azure.identity.aio import DefaultAzureCredential
 
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 FULLY_QUALIFIED_NAMESPACE = os.environ["EVENT_HUB_HOSTNAME"]
 EVENTHUB_NAME = os.environ["EVENT_HUB_NAME"]
 
@@ -38,19 +51,23 @@ async def batch_process_events(events):
 
 
 async def on_event_batch(partition_context, event_batch):
-    log.info("Partition {}, Received count: {}".format(partition_context.partition_id, len(event_batch)))
+    log.info("Partition %s, Received count: %d", partition_context.partition_id, len(event_batch))
+    if not event_batch:
+        # Nothing new to record; skip the checkpoint store write.
+        return
     await batch_process_events(event_batch)
-    await partition_context.update_checkpoint()
+    await partition_context.update_checkpoint(event_batch[-1])
 
 
 async def receive_batch():
+    credential = DefaultAzureCredential()
     checkpoint_store = BlobCheckpointStore(
-        blob_account_url=BLOB_ACCOUNT_URL, container_name=BLOB_CONTAINER_NAME, credential=DefaultAzureCredential()
+        blob_account_url=BLOB_ACCOUNT_URL, container_name=BLOB_CONTAINER_NAME, credential=credential
     )
     client = EventHubConsumerClient(
         fully_qualified_namespace=FULLY_QUALIFIED_NAMESPACE,
         eventhub_name=EVENTHUB_NAME,
-        credential=DefaultAzureCredential(),
+        credential=credential,
         consumer_group="$Default",
         checkpoint_store=checkpoint_store,
     )
@@ -58,6 +75,8 @@ async def receive_batch():
         await client.receive_batch(
             on_event_batch=on_event_batch,
             max_batch_size=100,
+            max_wait_time=5,  # Deliver partial (or empty) batches after 5 seconds on low-traffic partitions.
+            prefetch=300,  # About 3x max_batch_size keeps the AMQP receive window full between batches.
             starting_position="-1",  # "-1" is from the beginning of the partition.
         )
 
@@ -10,10 +10,22 @@ An example to show receiving events from an Event Hub with checkpoint store doin
 In the `receive_batch` method of `EventHubConsumerClient`:
 If no partition id is specified, the checkpoint_store are used for load-balance and checkpoint.
 If partition id is specified, the checkpoint_store can only be used for checkpoint without load balancing.
+
+A single credential instance is shared by the checkpoint store and the consumer client so that both use the
+same token cache instead of each acquiring tokens separately.
+
+Every checkpoint is a write to the checkpoint store, so this sample checkpoints the last event of every
+CHECKPOINT_EVERY_N_BATCHES-th batch of a partition rather than every batch. If the consumer stops, at most
+that many batches are received again from the last checkpoint.
+
+The sync client receives each partition on its own thread. When consuming many partitions, prefer the async
+client (see async_samples/receive_batch_with_checkpoint_async.py), which serves all partitions and their
+checkpoint writes from a single event loop.
 """
 
 import os
 import logging
+from collections import defaultdict
 from azure.eventhub import EventHubConsumerClient
 from azure.eventhub.extensions.checkpointstoreblob import BlobCheckpointStore
 from azure.identity import DefaultAzureCredential
@@ -26,25 +38,37 @@ protocol = os.environ.get("PROTOCOL", "https")
 suffix = os.environ.get("ACCOUNT_URL_SUFFIX", "core.windows.net")
 BLOB_ACCOUNT_URL = f"{protocol}://{storage_account_name}.blob.{suffix}"
 BLOB_CONTAINER_NAME = "your-blob-container-name"  # Please make sure the blob container resource exists.
+CHECKPOINT_EVERY_N_BATCHES = int(os.environ.get("CHECKPOINT_EVERY_N_BATCHES", 10))
 
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger(__name__)
 
 
+batches_since_checkpoint = defaultdict(int)
+
+
 def on_event_batch(partition_context, event_batch):
-    log.info("Partition {}, Received count: {}".format(partition_context.partition_id, len(event_batch)))
+    log.info("Partition %s, Received count: %d", partition_context.partition_id, len(event_batch))
+    if not event_batch:
+        # Nothing new to record; skip the checkpoint store write.
+        return
     # put your code here
-    partition_context.update_checkpoint()
+    batches_since_checkpoint[partition_context.partition_id] += 1
+    if batches_since_checkpoint[partition_context.partition_id] >= CHECKPOINT_EVERY_N_BATCHES:
+        # Checkpointing with an explicit event writes the position of that event in a single call.
+        partition_context.update_checkpoint(event_batch[-1])
+        batches_since_checkpoint[partition_context.partition_id] = 0
 
 
 def receive_batch():
+    credential = DefaultAzureCredential()
     checkpoint_store = BlobCheckpointStore(
-        blob_account_url=BLOB_ACCOUNT_URL, container_name=BLOB_CONTAINER_NAME, credential=DefaultAzureCredential()
+        blob_account_url=BLOB_ACCOUNT_URL, container_name=BLOB_CONTAINER_NAME, credential=credential
     )
     client = EventHubConsumerClient(
         fully_qualified_namespace=FULLY_QUALIFIED_NAMESPACE,
         eventhub_name=EVENTHUB_NAME,
-        credential=DefaultAzureCredential(),
+        credential=credential,
         consumer_group="$Default",
         checkpoint_store=checkpoint_store,
     )
@@ -52,6 +76,8 @@ def receive_batch():
         client.receive_batch(
             on_event_batch=on_event_batch,
             max_batch_size=100,
+            max_wait_time=5,  # Deliver partial (or empty) batches after 5 seconds on low-traffic partitions.
+            prefetch=300,  # About 3x max_batch_size keeps the AMQP receive window full between batches.
             starting_position="-1",  # "-1" is from the beginning of the partition.
         )
 
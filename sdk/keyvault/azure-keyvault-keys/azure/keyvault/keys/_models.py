@@ -106,6 +106,8 @@ class KeyProperties(object):
     :paramtype release_policy: ~azure.keyvault.keys.KeyReleasePolicy or None
     """
 
+    __slots__ = ("_attributes", "_id", "_vault_id", "_managed", "_tags", "_release_policy")
+
     def __init__(self, key_id: str, attributes: "Optional[_models.KeyAttributes]" = None, **kwargs: Any) -> None:
         self._attributes = attributes
         self._id = key_id
@@ -118,21 +120,22 @@ class KeyProperties(object):
         return f"<KeyProperties [{self.id}]>"[:1024]
 
     @classmethod
-    def _from_key_bundle(cls, key_bundle: Union["_models.KeyBundle", "_models.DeletedKeyBundle"]) -> "KeyProperties":
-        # pylint:disable=line-too-long
+    def _from_key_bundle(
+        cls, key_bundle: Union["_models.KeyBundle", "_models.DeletedKeyBundle"], key_id: Optional[str] = None
+    ) -> "KeyProperties":
+        # generated model fields are deserialized on every read, so each is read once
         # release_policy was added in 7.3-preview
+        bundle_policy = getattr(key_bundle, "release_policy", None)
         release_policy = None
-        if (
-            hasattr(key_bundle, "release_policy") and key_bundle.release_policy is not None  # type: ignore[attr-defined]
-        ):
+        if bundle_policy is not None:
             release_policy = KeyReleasePolicy(
-                encoded_policy=key_bundle.release_policy.encoded_policy,  # type: ignore
-                content_type=key_bundle.release_policy.content_type,  # type: ignore[attr-defined]
-                immutable=key_bundle.release_policy.immutable,  # type: ignore[attr-defined]
+                encoded_policy=bundle_policy.encoded_policy,
+                content_type=bundle_policy.content_type,
+                immutable=bundle_policy.immutable,
             )
 
         return cls(
-            key_bundle.key.kid,  # type: ignore
+            key_id or key_bundle.key.kid,  # type: ignore
             attributes=key_bundle.attributes,
             managed=key_bundle.managed,
             tags=key_bundle.tags,
@@ -328,6 +331,9 @@ class KeyReleasePolicy(object):
         updated after being marked immutable. Release policies are mutable by default.
     """
 
+    # __weakref__ keeps policies weak-referenceable, as they were before __slots__
+    __slots__ = ("encoded_policy", "content_type", "immutable", "__weakref__")
+
     def __init__(self, encoded_policy: bytes, **kwargs: Any) -> None:
         self.encoded_policy = encoded_policy
         self.content_type = kwargs.get("content_type", None)
@@ -457,6 +463,8 @@ class KeyVaultKey(object):
 
     """
 
+    __slots__ = ("_properties", "_key_material")
+
     def __init__(self, key_id: str, jwk: Optional[Dict[str, Any]] = None, **kwargs) -> None:
         self._properties: KeyProperties = kwargs.pop("properties", None) or KeyProperties(key_id, **kwargs)
         if isinstance(jwk, dict):
@@ -474,10 +482,12 @@ class KeyVaultKey(object):
     @classmethod
     def _from_key_bundle(cls, key_bundle: "_models.KeyBundle") -> "KeyVaultKey":
         # pylint:disable=protected-access
+        key = key_bundle.key
+        jwk = {field: getattr(key, field, None) for field in JsonWebKey._FIELDS}
         return cls(
-            key_id=key_bundle.key.kid,  # type: ignore
-            jwk={field: getattr(key_bundle.key, field, None) for field in JsonWebKey._FIELDS},
-            properties=KeyProperties._from_key_bundle(key_bundle),
+            key_id=jwk["kid"],
+            jwk=jwk,
+            properties=KeyProperties._from_key_bundle(key_bundle, key_id=jwk["kid"]),
         )
 
     @property
@@ -553,6 +563,8 @@ class KeyVaultKeyIdentifier(object):
             :dedent: 8
     """
 
+    __slots__ = ("_resource_id",)
+
     def __init__(self, source_id: str) -> None:
         self._resource_id = parse_key_vault_id(source_id)
 
@@ -589,6 +601,8 @@ class DeletedKey(KeyVaultKey):
     :type scheduled_purge_date: ~datetime.datetime or None
     """
 
+    __slots__ = ("_deleted_date", "_recovery_id", "_scheduled_purge_date")
+
     def __init__(
         self,
         properties: KeyProperties,
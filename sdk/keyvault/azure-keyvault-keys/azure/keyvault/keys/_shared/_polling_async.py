@@ -3,7 +3,7 @@
 # Licensed under the MIT License.
 # ------------------------------------
 import logging
-from typing import Any, Callable, cast
+from typing import Any, Callable, cast, Iterator, Optional
 
 from azure.core.exceptions import ResourceNotFoundError, HttpResponseError
 from azure.core.pipeline import PipelineResponse
@@ -32,20 +32,26 @@ class AsyncDeleteRecoverPollingMethod(AsyncPollingMethod):
     :type final_resource: Any
     :param bool finished: Whether or not the polling operation is completed.
     :param int interval: The polling interval, in seconds.
+    :param interval_generator: Intervals to wait between polls, in seconds. Overrides ``interval`` when provided.
+    :type interval_generator: Iterator[float] or None
     """
 
+    __slots__ = ("_pipeline_response", "_command", "_resource", "_polling_interval", "_intervals", "_finished")
+
     def __init__(
             self,
             pipeline_response: PipelineResponse,
             command: Callable,
             final_resource: Any,
             finished: bool,
-            interval: int = 2
+            interval: int = 2,
+            interval_generator: Optional[Iterator[float]] = None,
         ) -> None:
         self._pipeline_response = pipeline_response
         self._command = command
         self._resource = final_resource
         self._polling_interval = interval
+        self._intervals = interval_generator
         self._finished = finished
 
     def initialize(self, client, initial_response, deserialization_callback):
@@ -72,11 +78,14 @@ class AsyncDeleteRecoverPollingMethod(AsyncPollingMethod):
                 if not self.finished():
                     # We should always ask the client's transport to sleep, instead of sleeping directly
                     transport: AsyncHttpTransport = cast(AsyncHttpTransport, self._pipeline_response.context.transport)
-                    await transport.sleep(self._polling_interval)
+                    await transport.sleep(self._next_interval())
         except Exception as e:
             logger.warning(str(e))
             raise
 
+    def _next_interval(self) -> float:
+        return self._polling_interval if self._intervals is None else next(self._intervals)
+
     def finished(self) -> bool:
         return self._finished
 
@@ -99,6 +99,9 @@ class KeyVaultClientBase(object):
                 {"x-ms-keyvault-network-info", "x-ms-keyvault-region", "x-ms-keyvault-service-version"}
             )
 
+            # The challenge policy keeps the credential's token for reuse across requests and only asks the
+            # credential again shortly before the token expires or when the service issues a new challenge, so the
+            # credential is not wrapped in a separate token cache here.
             verify_challenge = kwargs.pop("verify_challenge_resource", True)
             self._client = _KeyVaultClient(
                 credential=credential,
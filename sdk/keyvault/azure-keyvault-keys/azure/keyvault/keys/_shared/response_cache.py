@@ -0,0 +1,106 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+from collections import OrderedDict
+import threading
+import time
+from typing import Any, Hashable, Optional, Tuple
+
+
+class ResponseCache(object):
+    """A bounded, thread-safe cache of service responses that callers read with a maximum acceptable age.
+
+    Entries are evicted least recently used first once ``maxsize`` is reached. The age limit is given on each read
+    rather than on write, so one cache can serve callers with different staleness tolerances.
+
+    Entries belong to groups, typically the name of the resource they describe, which are discarded together when the
+    resource changes. A response requested before such a change must not be cached after it, so callers read
+    :func:`generation` before sending a request and pass it to :func:`set` with the response.
+
+    :param int maxsize: The maximum number of entries to keep.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, Hashable]]" = OrderedDict()
+        self._generation = 0
+        # the generation at which each recently discarded group was discarded. Older discards are forgotten, and
+        # treated as having happened at the latest generation forgotten, which can only reject more values
+        self._discarded: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._discarded_before = 0
+        self._lock = threading.Lock()
+
+    def generation(self) -> int:
+        """Get the cache's current generation, which advances whenever entries are discarded.
+
+        :returns: The current generation.
+        :rtype: int
+        """
+        with self._lock:
+            return self._generation
+
+    def get(self, key: Hashable, max_age: float) -> Optional[Any]:
+        """Get a cached value no older than ``max_age`` seconds.
+
+        :param key: The entry's key.
+        :type key: Hashable
+        :param float max_age: The maximum age of an acceptable entry, in seconds.
+
+        :returns: The cached value, or None if there is no entry for ``key`` or the entry is too old.
+        :rtype: Any or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= max_age:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, group: Hashable, generation: int) -> None:
+        """Cache a value, unless its group has been discarded since ``generation``.
+
+        :param key: The entry's key.
+        :type key: Hashable
+        :param value: The value to cache.
+        :type value: Any
+        :param group: The group the entry belongs to.
+        :type group: Hashable
+        :param int generation: The cache's generation when the value was requested.
+        """
+        with self._lock:
+            if generation < self._discarded.get(group, self._discarded_before):
+                return
+            self._entries[key] = (time.monotonic(), value, group)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def discard_group(self, group: Hashable) -> int:
+        """Remove every entry in ``group``, and reject values for it requested before now.
+
+        :param group: The group to discard.
+        :type group: Hashable
+
+        :returns: The cache's new generation.
+        :rtype: int
+        """
+        with self._lock:
+            self._generation += 1
+            self._discarded[group] = self._generation
+            self._discarded.move_to_end(group)
+            while len(self._discarded) > self._maxsize:
+                self._discarded_before = self._discarded.popitem(last=False)[1]
+            for key in [key for key, entry in self._entries.items() if entry[2] == group]:
+                del self._entries[key]
+            return self._generation
+
+    def clear(self) -> None:
+        """Remove every entry, and reject values requested before now."""
+        with self._lock:
+            self._generation += 1
+            self._discarded.clear()
+            self._discarded_before = self._generation
+            self._entries.clear()
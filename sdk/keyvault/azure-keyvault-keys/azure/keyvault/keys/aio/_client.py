@@ -3,20 +3,25 @@
 # Licensed under the MIT License.
 # ------------------------------------
 # pylint:disable=too-many-lines
+from copy import deepcopy
 from datetime import datetime
-from functools import partial
-from typing import Any, Dict, List, Optional, Union
+import json
+from functools import cached_property, lru_cache, partial
+from itertools import accumulate, repeat
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union, TYPE_CHECKING
 
+from azure.core.credentials_async import AsyncTokenCredential
 from azure.core.async_paging import AsyncItemPaged
 from azure.core.tracing.decorator import distributed_trace
 from azure.core.tracing.decorator_async import distributed_trace_async
 
-from ..crypto.aio import CryptographyClient
-from .._client import _get_key_id
+from .._client import _deleted_key_items, _key_properties_items, _return_pipeline_and_deserialized
 from .._enums import KeyCurveName, KeyExportEncryptionAlgorithm, KeyOperation
-from .._generated.models import KeyAttributes
+from .._generated.models import KeyAttributes, KeyCreateParameters
+from .._shared._polling import adaptive_polling_interval
 from .._shared._polling_async import AsyncDeleteRecoverPollingMethod
 from .._shared import AsyncKeyVaultClientBase
+from .._shared.response_cache import ResponseCache
 from .. import (
     DeletedKey,
     JsonWebKey,
@@ -29,6 +34,10 @@ from .. import (
     ReleaseKeyResult,
 )
 
+if TYPE_CHECKING:
+    # importing the crypto package loads cryptography, so only get_cryptography_client imports it at runtime
+    from ..crypto.aio import CryptographyClient
+
 
 class KeyClient(AsyncKeyVaultClientBase):
     """A high-level asynchronous interface for managing a vault's keys.
@@ -56,6 +65,31 @@ class KeyClient(AsyncKeyVaultClientBase):
 
     # pylint:disable=protected-access, too-many-public-methods
 
+    def __init__(self, vault_url: str, credential: AsyncTokenCredential, **kwargs: Any) -> None:
+        super().__init__(vault_url, credential, **kwargs)
+        # bind the generated models that requests are built from once, rather than on every call
+        models = self._models
+        self._key_attributes_model = models.KeyAttributes
+        self._key_create_parameters_model = models.KeyCreateParameters
+        self._key_update_parameters_model = models.KeyUpdateParameters
+        self._key_import_parameters_model = models.KeyImportParameters
+        self._key_restore_parameters_model = models.KeyRestoreParameters
+        self._key_release_parameters_model = models.KeyReleaseParameters
+        self._key_release_policy_model = models.KeyReleasePolicy
+        self._random_bytes_request_model = models.GetRandomBytesRequest
+        self._response_cache = ResponseCache()
+
+    def _forget_cached(self, name: str) -> int:
+        return self._response_cache.discard_group(name.lower())
+
+    @cached_property
+    def _keys_base(self) -> str:
+        return self._vault_url + "/keys/"
+
+    def _key_id(self, name: str, version: Optional[str] = None) -> str:
+        keys_base = self._keys_base
+        return f"{keys_base}{name}/{version}" if version else keys_base + name
+
     def _get_attributes(
         self,
         enabled: Optional[bool],
@@ -78,18 +112,93 @@ class KeyClient(AsyncKeyVaultClientBase):
         :rtype: KeyAttributes
         """
         if enabled is not None or not_before is not None or expires_on is not None or exportable is not None:
-            return self._models.KeyAttributes(
+            return self._key_attributes_model(
                 enabled=enabled, not_before=not_before, expires=expires_on, exportable=exportable
             )
         return None
 
+    @cached_property
+    def _interned_release_policy(self) -> Callable[[bytes, Optional[str], Optional[bool]], Any]:
+        model = self._key_release_policy_model
+
+        @lru_cache(maxsize=256)
+        def build(encoded_policy: bytes, content_type: Optional[str], immutable: Optional[bool]) -> Any:
+            return model(encoded_policy=encoded_policy, content_type=content_type, immutable=immutable)
+
+        return build
+
+    def _get_release_policy(self, release_policy: Optional[KeyReleasePolicy]) -> Optional[Any]:
+        """Return the generated release policy model for ``release_policy``.
+
+        Policies with equal fields share one model, so a policy applied to many keys is only built once.
+
+        :param release_policy: The release policy provided by the caller.
+        :type release_policy: ~azure.keyvault.keys.KeyReleasePolicy or None
+
+        :returns: The generated release policy model, or None if no policy was provided
+        :rtype: KeyReleasePolicy or None
+        """
+        if release_policy is None or isinstance(release_policy, self._key_release_policy_model):
+            # a generated model is already in wire form
+            return release_policy
+        encoded_policy, content_type, immutable = (
+            release_policy.encoded_policy,
+            release_policy.content_type,
+            release_policy.immutable,
+        )
+        try:
+            return self._interned_release_policy(encoded_policy, content_type, immutable)
+        except TypeError:  # an unhashable field, such as a bytearray policy, can't be interned
+            return self._key_release_policy_model(
+                encoded_policy=encoded_policy, content_type=content_type, immutable=immutable
+            )
+
+    def _build_create_params(
+        self,
+        key_type: Union[str, KeyType],
+        *,
+        size: Optional[int] = None,
+        curve: Optional[Union[str, KeyCurveName]] = None,
+        public_exponent: Optional[int] = None,
+        key_operations: Optional[List[Union[str, KeyOperation]]] = None,
+        enabled: Optional[bool] = None,
+        tags: Optional[Dict[str, str]] = None,
+        not_before: Optional[datetime] = None,
+        expires_on: Optional[datetime] = None,
+        exportable: Optional[bool] = None,
+        release_policy: Optional[KeyReleasePolicy] = None,
+    ) -> KeyCreateParameters:
+        """Assemble the generated create-key request body shared by the ``create_*_key`` methods.
+
+        :param key_type: The type of key to create
+        :type key_type: ~azure.keyvault.keys.KeyType or str
+
+        :returns: The parameters for a create-key request
+        :rtype: KeyCreateParameters
+        """
+        attributes = self._get_attributes(
+            enabled=enabled, not_before=not_before, expires_on=expires_on, exportable=exportable
+        )
+
+        policy = self._get_release_policy(release_policy)
+        return self._key_create_parameters_model(
+            kty=key_type,
+            key_size=size,
+            key_attributes=attributes,
+            key_ops=key_operations,
+            tags=tags,
+            curve=curve,
+            public_exponent=public_exponent,
+            release_policy=policy,
+        )
+
     def get_cryptography_client(
             self,
             key_name: str,
             *,
             key_version: Optional[str] = None,
             **kwargs,  # pylint: disable=unused-argument
-        ) -> CryptographyClient:
+        ) -> "CryptographyClient":
         """Gets a :class:`~azure.keyvault.keys.crypto.aio.CryptographyClient` for the given key.
 
         :param str key_name: The name of the key used to perform cryptographic operations.
@@ -101,9 +210,11 @@ class KeyClient(AsyncKeyVaultClientBase):
             HTTP client as this :class:`~azure.keyvault.keys.aio.KeyClient`.
         :rtype: ~azure.keyvault.keys.crypto.aio.CryptographyClient
         """
-        key_id = _get_key_id(self._vault_url, key_name, key_version)
+        key_id = self._key_id(key_name, key_version)
 
         # We provide a fake credential because the generated client already has the KeyClient's real credential
+        from ..crypto.aio import CryptographyClient  # pylint:disable=import-outside-toplevel
+
         return CryptographyClient(
             key_id, object(), generated_client=self._client, generated_models=self._models  # type: ignore
         )
@@ -170,31 +281,21 @@ class KeyClient(AsyncKeyVaultClientBase):
                 :caption: Create a key
                 :dedent: 8
         """
-        attributes = self._get_attributes(
-            enabled=enabled, not_before=not_before, expires_on=expires_on, exportable=exportable
-        )
-
-        policy = release_policy
-        if policy is not None:
-            policy = self._models.KeyReleasePolicy(
-                encoded_policy=policy.encoded_policy, content_type=policy.content_type, immutable=policy.immutable
-            )
-        parameters = self._models.KeyCreateParameters(
-            kty=key_type,
-            key_size=size,
-            key_attributes=attributes,
-            key_ops=key_operations,
-            tags=tags,
+        parameters = self._build_create_params(
+            key_type,
+            size=size,
             curve=curve,
             public_exponent=public_exponent,
-            release_policy=policy,
-        )
-
-        bundle = await self._client.create_key(
-            key_name=name,
-            parameters=parameters,
-            **kwargs,
+            key_operations=key_operations,
+            enabled=enabled,
+            tags=tags,
+            not_before=not_before,
+            expires_on=expires_on,
+            exportable=exportable,
+            release_policy=release_policy,
         )
+        bundle = await self._client.create_key(key_name=name, parameters=parameters, **kwargs)
+        self._forget_cached(name)
         return KeyVaultKey._from_key_bundle(bundle)
 
     @distributed_trace_async
@@ -255,9 +356,8 @@ class KeyClient(AsyncKeyVaultClientBase):
                 :caption: Create RSA key
                 :dedent: 8
         """
-        return await self.create_key(
-            name,
-            key_type="RSA-HSM" if hardware_protected else "RSA",
+        parameters = self._build_create_params(
+            "RSA-HSM" if hardware_protected else "RSA",
             size=size,
             public_exponent=public_exponent,
             key_operations=key_operations,
@@ -267,8 +367,10 @@ class KeyClient(AsyncKeyVaultClientBase):
             expires_on=expires_on,
             exportable=exportable,
             release_policy=release_policy,
-            **kwargs,
         )
+        bundle = await self._client.create_key(key_name=name, parameters=parameters, **kwargs)
+        self._forget_cached(name)
+        return KeyVaultKey._from_key_bundle(bundle)
 
     @distributed_trace_async
     async def create_ec_key(
@@ -325,9 +427,8 @@ class KeyClient(AsyncKeyVaultClientBase):
                 :caption: Create an elliptic curve key
                 :dedent: 8
         """
-        return await self.create_key(
-            name,
-            key_type="EC-HSM" if hardware_protected else "EC",
+        parameters = self._build_create_params(
+            "EC-HSM" if hardware_protected else "EC",
             curve=curve,
             key_operations=key_operations,
             enabled=enabled,
@@ -336,8 +437,10 @@ class KeyClient(AsyncKeyVaultClientBase):
             expires_on=expires_on,
             exportable=exportable,
             release_policy=release_policy,
-            **kwargs,
         )
+        bundle = await self._client.create_key(key_name=name, parameters=parameters, **kwargs)
+        self._forget_cached(name)
+        return KeyVaultKey._from_key_bundle(bundle)
 
     @distributed_trace_async
     async def create_oct_key(
@@ -394,9 +497,8 @@ class KeyClient(AsyncKeyVaultClientBase):
                 :caption: Create an octet sequence (symmetric) key
                 :dedent: 8
         """
-        return await self.create_key(
-            name,
-            key_type="oct-HSM" if hardware_protected else "oct",
+        parameters = self._build_create_params(
+            "oct-HSM" if hardware_protected else "oct",
             size=size,
             key_operations=key_operations,
             enabled=enabled,
@@ -405,11 +507,15 @@ class KeyClient(AsyncKeyVaultClientBase):
             expires_on=expires_on,
             exportable=exportable,
             release_policy=release_policy,
-            **kwargs,
         )
+        bundle = await self._client.create_key(key_name=name, parameters=parameters, **kwargs)
+        self._forget_cached(name)
+        return KeyVaultKey._from_key_bundle(bundle)
 
     @distributed_trace_async
-    async def delete_key(self, name: str, **kwargs: Any) -> DeletedKey:
+    async def delete_key(
+        self, name: str, *, _polling_interval: Optional[float] = None, **kwargs: Any
+    ) -> DeletedKey:
         """Delete all versions of a key and its cryptographic material.
 
         Requires keys/delete permission. If the vault has soft-delete enabled, deletion may take several seconds to
@@ -431,23 +537,23 @@ class KeyClient(AsyncKeyVaultClientBase):
                 :caption: Delete a key
                 :dedent: 8
         """
-        polling_interval = kwargs.pop("_polling_interval", None)
-        if polling_interval is None:
-            polling_interval = 2
         pipeline_response, deleted_key_bundle = await self._client.delete_key(
             key_name=name,
-            cls=lambda pipeline_response, deserialized, _: (pipeline_response, deserialized),
+            cls=_return_pipeline_and_deserialized,
             **kwargs,
         )
+        self._forget_cached(name)
         deleted_key = DeletedKey._from_deleted_key_bundle(deleted_key_bundle)
+        if deleted_key.recovery_id is None:
+            # no recovery ID means soft-delete is disabled, in which case the key is already deleted
+            return deleted_key
 
         polling_method = AsyncDeleteRecoverPollingMethod(
-            # no recovery ID means soft-delete is disabled, in which case we initialize the poller as finished
-            finished=deleted_key.recovery_id is None,
+            finished=False,
             pipeline_response=pipeline_response,
             command=partial(self.get_deleted_key, name=name, **kwargs),
             final_resource=deleted_key,
-            interval=polling_interval,
+            interval_generator=adaptive_polling_interval() if _polling_interval is None else repeat(_polling_interval),
         )
         await polling_method.run()
 
@@ -528,7 +634,7 @@ class KeyClient(AsyncKeyVaultClientBase):
         """
         return self._client.get_deleted_keys(
             maxresults=kwargs.pop("max_page_size", None),
-            cls=lambda objs: [DeletedKey._from_deleted_key_item(x) for x in objs],
+            cls=_deleted_key_items,
             **kwargs,
         )
 
@@ -551,7 +657,7 @@ class KeyClient(AsyncKeyVaultClientBase):
         """
         return self._client.get_keys(
             maxresults=kwargs.pop("max_page_size", None),
-            cls=lambda objs: [KeyProperties._from_key_item(x) for x in objs],
+            cls=_key_properties_items,
             **kwargs,
         )
 
@@ -577,7 +683,7 @@ class KeyClient(AsyncKeyVaultClientBase):
         return self._client.get_key_versions(
             name,
             maxresults=kwargs.pop("max_page_size", None),
-            cls=lambda objs: [KeyProperties._from_key_item(x) for x in objs],
+            cls=_key_properties_items,
             **kwargs,
         )
 
@@ -609,7 +715,9 @@ class KeyClient(AsyncKeyVaultClientBase):
         await self._client.purge_deleted_key(name, **kwargs)
 
     @distributed_trace_async
-    async def recover_deleted_key(self, name: str, **kwargs: Any) -> KeyVaultKey:
+    async def recover_deleted_key(
+        self, name: str, *, _polling_interval: Optional[float] = None, **kwargs: Any
+    ) -> KeyVaultKey:
         """Recover a deleted key to its latest version. Possible only in a vault with soft-delete enabled.
 
         Requires keys/recover permission. If the vault does not have soft-delete enabled, :func:`delete_key` is
@@ -631,12 +739,10 @@ class KeyClient(AsyncKeyVaultClientBase):
                 :caption: Recover a deleted key
                 :dedent: 8
         """
-        polling_interval = kwargs.pop("_polling_interval", None)
-        if polling_interval is None:
-            polling_interval = 2
+        intervals = adaptive_polling_interval() if _polling_interval is None else repeat(_polling_interval)
         pipeline_response, recovered_key_bundle = await self._client.recover_deleted_key(
             key_name=name,
-            cls=lambda pipeline_response, deserialized, _: (pipeline_response, deserialized),
+            cls=_return_pipeline_and_deserialized,
             **kwargs,
         )
         recovered_key = KeyVaultKey._from_key_bundle(recovered_key_bundle)
@@ -647,7 +753,7 @@ class KeyClient(AsyncKeyVaultClientBase):
             command=command,
             final_resource=recovered_key,
             finished=False,
-            interval=polling_interval
+            interval_generator=intervals,
         )
         await polling_method.run()
 
@@ -704,12 +810,8 @@ class KeyClient(AsyncKeyVaultClientBase):
         """
         attributes = self._get_attributes(enabled=enabled, not_before=not_before, expires_on=expires_on)
 
-        policy = release_policy
-        if policy is not None:
-            policy = self._models.KeyReleasePolicy(
-                content_type=policy.content_type, encoded_policy=policy.encoded_policy, immutable=policy.immutable
-            )
-        parameters = self._models.KeyUpdateParameters(
+        policy = self._get_release_policy(release_policy)
+        parameters = self._key_update_parameters_model(
             key_ops=key_operations,
             key_attributes=attributes,
             tags=tags,
@@ -722,6 +824,7 @@ class KeyClient(AsyncKeyVaultClientBase):
             parameters=parameters,
             **kwargs,
         )
+        self._forget_cached(name)
         return KeyVaultKey._from_key_bundle(bundle)
 
     @distributed_trace_async
@@ -752,14 +855,18 @@ class KeyClient(AsyncKeyVaultClientBase):
         return backup_result.value
 
     @distributed_trace_async
-    async def restore_key_backup(self, backup: bytes, **kwargs: Any) -> KeyVaultKey:
+    async def restore_key_backup(
+        self, backup: Union[bytes, bytearray, memoryview], **kwargs: Any
+    ) -> KeyVaultKey:
         """Restore a key backup to the vault.
 
         Requires keys/restore permission. This imports all versions of the key, with its name, attributes, and access
         control policies. If the key's name is already in use, restoring it will fail. Also, the target vault must be
         owned by the same Microsoft Azure subscription as the source vault.
 
-        :param bytes backup: A key backup as returned by :func:`backup_key`
+        :param backup: A key backup as returned by :func:`backup_key`. A bytearray or memoryview over the backup
+            can be passed in place of bytes.
+        :type backup: bytes or bytearray or memoryview
 
         :returns: The restored key
         :rtype: ~azure.keyvault.keys.KeyVaultKey
@@ -775,8 +882,11 @@ class KeyClient(AsyncKeyVaultClientBase):
                 :caption: Restore a key backup
                 :dedent: 8
         """
+        if isinstance(backup, memoryview):
+            # the generated serializer base64-encodes bytes-like objects but doesn't recognize memoryview
+            backup = backup.tobytes()
         bundle = await self._client.restore_key(
-            parameters=self._models.KeyRestoreParameters(key_bundle_backup=backup),
+            parameters=self._key_restore_parameters_model(key_bundle_backup=backup),
             **kwargs,
         )
         return KeyVaultKey._from_key_bundle(bundle)
@@ -828,12 +938,8 @@ class KeyClient(AsyncKeyVaultClientBase):
             enabled=enabled, not_before=not_before, expires_on=expires_on, exportable=exportable
         )
 
-        policy = release_policy
-        if policy is not None:
-            policy = self._models.KeyReleasePolicy(
-                content_type=policy.content_type, encoded_policy=policy.encoded_policy, immutable=policy.immutable
-            )
-        parameters = self._models.KeyImportParameters(
+        policy = self._get_release_policy(release_policy)
+        parameters = self._key_import_parameters_model(
             key=key._to_generated_model(),
             key_attributes=attributes,
             hsm=hardware_protected,
@@ -844,6 +950,7 @@ class KeyClient(AsyncKeyVaultClientBase):
         bundle = await self._client.import_key(
             name, parameters=parameters, **kwargs
         )
+        self._forget_cached(name)
         return KeyVaultKey._from_key_bundle(bundle)
 
     @distributed_trace_async
@@ -880,7 +987,7 @@ class KeyClient(AsyncKeyVaultClientBase):
         result = await self._client.release(
             key_name=name,
             key_version=version or "",
-            parameters=self._models.KeyReleaseParameters(
+            parameters=self._key_release_parameters_model(
                 target_attestation_token=target_attestation_token,
                 nonce=nonce,
                 enc=algorithm,
@@ -911,23 +1018,66 @@ class KeyClient(AsyncKeyVaultClientBase):
         """
         if count < 1:
             raise ValueError("At least one random byte must be requested")
-        parameters = self._models.GetRandomBytesRequest(count=count)
+        parameters = self._random_bytes_request_model(count=count)
         result = await self._client.get_random_bytes(parameters=parameters, **kwargs)
         return result.value
 
     @distributed_trace_async
-    async def get_key_rotation_policy(self, key_name: str, **kwargs: Any) -> KeyRotationPolicy:
+    async def get_random_bytes_batch(self, sizes: Sequence[int], **kwargs: Any) -> List[bytes]:
+        """Get several draws of random bytes from a managed HSM in a single request.
+
+        The bytes for every draw are requested together and split locally, so many small draws cost one round trip.
+
+        :param sizes: The requested number of random bytes for each draw.
+        :type sizes: Sequence[int]
+
+        :return: The random bytes for each draw, in the order of ``sizes``.
+        :rtype: list[bytes]
+
+        :raises ValueError or ~azure.core.exceptions.HttpResponseError:
+            the former if no draws are requested or any draw is for less than one byte; the latter for other errors
+        """
+        if not sizes or min(sizes) < 1:
+            raise ValueError("At least one random byte must be requested for each draw")
+        parameters = self._random_bytes_request_model(count=sum(sizes))
+        result = await self._client.get_random_bytes(parameters=parameters, **kwargs)
+        random_bytes = result.value
+        return [random_bytes[end - size : end] for size, end in zip(sizes, accumulate(sizes))]
+
+    @distributed_trace_async
+    async def get_key_rotation_policy(
+        self, key_name: str, *, cache_ttl: Optional[float] = None, **kwargs: Any
+    ) -> KeyRotationPolicy:
         """Get the rotation policy of a Key Vault key.
 
         :param str key_name: The name of the key.
 
+        :keyword cache_ttl: If set, return a policy this client fetched no more than ``cache_ttl`` seconds ago
+            instead of requesting it again, and cache the fetched policy for later calls. Policies are not cached by
+            default. Changing or deleting the key, or its rotation policy, through this client discards its cached
+            policy.
+        :paramtype cache_ttl: float or None
+
         :return: The key rotation policy.
         :rtype: ~azure.keyvault.keys.KeyRotationPolicy
 
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        policy = await self._client.get_key_rotation_policy(key_name=key_name, **kwargs)
-        return KeyRotationPolicy._from_generated(policy)
+        if not cache_ttl:
+            policy = await self._client.get_key_rotation_policy(key_name=key_name, **kwargs)
+            return KeyRotationPolicy._from_generated(policy)
+
+        cache_key = ("rotation_policy", key_name.lower())
+        cached = self._response_cache.get(cache_key, cache_ttl)
+        if cached is None:
+            # the key may change before the response arrives, which then mustn't be cached
+            generation = self._response_cache.generation()
+            cached = KeyRotationPolicy._from_generated(
+                await self._client.get_key_rotation_policy(key_name=key_name, **kwargs)
+            )
+            self._response_cache.set(cache_key, cached, cache_key[1], generation)
+        # callers get copies, so one modifying its policy can't change what the next is given
+        return deepcopy(cached)
 
     @distributed_trace_async
     async def rotate_key(self, name: str, **kwargs: Any) -> KeyVaultKey:
@@ -943,6 +1093,7 @@ class KeyClient(AsyncKeyVaultClientBase):
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         bundle = await self._client.rotate_key(key_name=name, **kwargs)
+        self._forget_cached(name)
         return KeyVaultKey._from_key_bundle(bundle)
 
     @distributed_trace_async
@@ -953,6 +1104,7 @@ class KeyClient(AsyncKeyVaultClientBase):
         *,
         lifetime_actions: Optional[List[KeyRotationLifetimeAction]] = None,
         expires_in: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
         **kwargs: Any,
     ) -> KeyRotationPolicy:
         """Updates the rotation policy of a Key Vault key.
@@ -970,31 +1122,57 @@ class KeyClient(AsyncKeyVaultClientBase):
             ISO 8601 duration. For example: 90 days is "P90D", 3 months is "P3M", and 48 hours is "PT48H". See
             `Wikipedia <https://wikipedia.org/wiki/ISO_8601#Durations>`_ for more information on ISO 8601 durations.
             This will override the expiry time of the provided ``policy``.
+        :keyword cache_ttl: If set, skip the request when this client successfully sent an identical policy for the key
+            no more than ``cache_ttl`` seconds ago, and return the policy the service returned then. Requests are
+            always sent by default. Changing or deleting the key through this client discards the record of sent
+            policies.
+        :paramtype cache_ttl: float or None
 
         :return: The updated rotation policy.
         :rtype: ~azure.keyvault.keys.KeyRotationPolicy
 
         :raises ~azure.core.exceptions.HttpResponseError:
         """
+        models = self._models
         actions = lifetime_actions or policy.lifetime_actions
         if actions:
+            lifetime_action, action_type, trigger = (
+                models.LifetimeActions,
+                models.LifetimeActionsType,
+                models.LifetimeActionsTrigger,
+            )
             actions = [
-                self._models.LifetimeActions(
-                    action=self._models.LifetimeActionsType(type=action.action),
-                    trigger=self._models.LifetimeActionsTrigger(
+                lifetime_action(
+                    action=action_type(type=action.action),
+                    trigger=trigger(
                         time_after_create=action.time_after_create, time_before_expiry=action.time_before_expiry
                     ),
                 )
                 for action in actions
             ]
 
-        attributes = self._models.KeyRotationPolicyAttributes(expiry_time=expires_in or policy.expires_in)
-        new_policy = self._models.KeyRotationPolicy(lifetime_actions=actions or [], attributes=attributes)
+        attributes = models.KeyRotationPolicyAttributes(expiry_time=expires_in or policy.expires_in)
+        new_policy = models.KeyRotationPolicy(lifetime_actions=actions or [], attributes=attributes)
+        cache_key = None
+        if cache_ttl:
+            cache_key = ("sent_rotation_policy", key_name.lower(), json.dumps(new_policy.as_dict(), sort_keys=True))
+            cached = self._response_cache.get(cache_key, cache_ttl)
+            if cached is not None:
+                return deepcopy(cached)
+
+        generation = self._response_cache.generation()
         result = await self._client.update_key_rotation_policy(key_name=key_name, key_rotation_policy=new_policy)
-        return KeyRotationPolicy._from_generated(result)
+        updated_policy = KeyRotationPolicy._from_generated(result)
+        # the response is cached only if this update is the only change to the cache since the request was sent
+        if self._forget_cached(key_name) == generation + 1 and cache_key:
+            self._response_cache.set(cache_key, updated_policy, cache_key[1], generation + 1)
+            return deepcopy(updated_policy)
+        return updated_policy
 
     @distributed_trace_async
-    async def get_key_attestation(self, name: str, version: Optional[str] = None, **kwargs: Any) -> KeyVaultKey:
+    async def get_key_attestation(
+        self, name: str, version: Optional[str] = None, *, cache_ttl: Optional[float] = None, **kwargs: Any
+    ) -> KeyVaultKey:
         """Get a key and its attestation blob.
         
         This method is applicable to any key stored in Azure Key Vault Managed HSM. This operation requires the keys/get
@@ -1005,13 +1183,39 @@ class KeyClient(AsyncKeyVaultClientBase):
             of the key.
         :type version: str or None
 
+        :keyword cache_ttl: If set, return an attestation this client fetched no more than ``cache_ttl`` seconds ago
+            instead of requesting it again, and cache the fetched attestation for later calls. Attestations are not
+            cached by default. Creating, importing, updating, rotating or deleting the key through this client discards
+            its cached attestations.
+        :paramtype cache_ttl: float or None
+
         :return: The key attestation.
         :rtype: ~azure.keyvault.keys.KeyAttestation
 
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        bundle = await self._client.get_key_attestation(key_name=name, key_version=version or "", **kwargs)
-        return KeyVaultKey._from_key_bundle(bundle)
+        if not cache_ttl:
+            bundle = await self._client.get_key_attestation(key_name=name, key_version=version or "", **kwargs)
+            return KeyVaultKey._from_key_bundle(bundle)
+
+        cache_key = ("attestation", name.lower(), version or "")
+        cached = self._response_cache.get(cache_key, cache_ttl)
+        if cached is None:
+            # the key may change before the response arrives, which then mustn't be cached
+            generation = self._response_cache.generation()
+            cached = KeyVaultKey._from_key_bundle(
+                await self._client.get_key_attestation(key_name=name, key_version=version or "", **kwargs)
+            )
+            self._response_cache.set(cache_key, cached, cache_key[1], generation)
+        # callers get copies, so one modifying its key can't change what the next is given
+        return deepcopy(cached)
+
+    def clear_cache(self) -> None:
+        """Discard every rotation policy and key attestation this client has cached.
+
+        Only reads made with a ``cache_ttl`` are cached. Use this when keys may have changed outside this client.
+        """
+        self._response_cache.clear()
 
     async def __aenter__(self) -> "KeyClient":
         await self._client.__aenter__()
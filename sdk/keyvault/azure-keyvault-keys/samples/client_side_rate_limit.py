@@ -0,0 +1,109 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from azure.core.pipeline.policies import HTTPPolicy
+from azure.identity import DefaultAzureCredential
+from azure.keyvault.keys import KeyClient
+
+# ----------------------------------------------------------------------------------------------------------
+# Prerequisites:
+# 1. An Azure Key Vault (https://learn.microsoft.com/azure/key-vault/quick-create-cli)
+#
+# 2. azure-keyvault-keys and azure-identity libraries (pip install these)
+#
+# 3. Set environment variable VAULT_URL with the URL of your key vault
+#
+# 4. Set up your environment to use azure-identity's DefaultAzureCredential. For more information about how to configure
+#    the DefaultAzureCredential, refer to https://aka.ms/azsdk/python/identity/docs#azure.identity.DefaultAzureCredential
+#
+# 5. Key create, get, and delete permissions for your service principal in your vault
+#
+# ----------------------------------------------------------------------------------------------------------
+# Sample - demonstrates limiting a KeyClient's request rate on the client side
+#
+# Key Vault throttles a vault that receives more requests than its service limits allow, answering with HTTP 429. The
+# client retries those requests after the interval the service asks for, but each throttled attempt is a wasted round
+# trip. A process that knows it will send bursts can instead pace its own requests with a pipeline policy, so that
+# requests wait locally rather than being rejected. This sample's policy is a token bucket that halves its rate when
+# the service throttles a request anyway, and slowly recovers as requests succeed.
+#
+# 1. Define a rate limiting policy
+#
+# 2. Create a KeyClient with the policy (per_retry_policies)
+#
+# 3. Create and get keys concurrently (create_rsa_key, get_key)
+#
+# 4. Delete the keys (begin_delete_key)
+# ----------------------------------------------------------------------------------------------------------
+
+
+# [START rate_limit_policy]
+class RateLimitPolicy(HTTPPolicy):
+    """Paces requests with a token bucket, lowering the rate when the service throttles a request."""
+
+    def __init__(self, requests_per_second: float, minimum_rate: float = 1.0) -> None:
+        super().__init__()
+        self._max_rate = self._rate = requests_per_second
+        self._min_rate = minimum_rate
+        self._tokens = requests_per_second
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                # the bucket holds at least one token, or a rate below one request per second would never allow one
+                self._tokens = min(max(1.0, self._rate), self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+    def send(self, request):
+        self._acquire()
+        response = self.next.send(request)
+        with self._lock:
+            if response.http_response.status_code == 429:
+                self._rate = max(self._min_rate, self._rate / 2)
+            else:
+                self._rate = min(self._max_rate, self._rate + 1)
+        return response
+
+
+# [END rate_limit_policy]
+
+VAULT_URL = os.environ["VAULT_URL"]
+credential = DefaultAzureCredential()
+
+# [START create_rate_limited_client]
+# as a per-retry policy, the limiter also paces the client's retries of throttled requests
+client = KeyClient(
+    vault_url=VAULT_URL, credential=credential, per_retry_policies=[RateLimitPolicy(requests_per_second=50)]
+)
+# [END create_rate_limited_client]
+
+key_names = [f"rateLimitedKeyName{i}" for i in range(20)]
+with ThreadPoolExecutor(max_workers=8) as executor:
+    print("\n.. Create keys concurrently")
+    for key in executor.map(client.create_rsa_key, key_names):
+        print(f"Created key '{key.name}'")
+
+    print("\n.. Get the keys concurrently")
+    for key in executor.map(client.get_key, key_names):
+        print(f"Got key '{key.name}' with type '{key.key_type}'")
+
+print("\n.. Delete the keys")
+for key_name in key_names:
+    client.begin_delete_key(key_name).wait()
+    print(f"Deleted key '{key_name}'")
+
+print("\nrun_sample done")
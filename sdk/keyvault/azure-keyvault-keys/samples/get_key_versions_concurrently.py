@@ -0,0 +1,67 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from azure.identity import DefaultAzureCredential
+from azure.keyvault.keys import KeyClient
+
+# ----------------------------------------------------------------------------------------------------------
+# Prerequisites:
+# 1. An Azure Key Vault (https://learn.microsoft.com/azure/key-vault/quick-create-cli)
+#
+# 2. azure-keyvault-keys and azure-identity libraries (pip install these)
+#
+# 3. Set environment variable VAULT_URL with the URL of your key vault
+#
+# 4. Set up your environment to use azure-identity's DefaultAzureCredential. For more information about how to configure
+#    the DefaultAzureCredential, refer to https://aka.ms/azsdk/python/identity/docs#azure.identity.DefaultAzureCredential
+#
+# 5. Key create, get, list, and delete permissions for your service principal in your vault
+#
+# ----------------------------------------------------------------------------------------------------------
+# Sample - demonstrates fetching every version of a key with concurrent requests
+#
+# Listing key versions returns only their properties, and Key Vault has no multi-key GET. Fetching each version one
+# after another costs one round trip per version; a KeyClient is thread-safe, so the requests can instead run in
+# parallel over the client's connection pool. Keep the concurrency modest to stay within the vault's service limits.
+# Requests the vault throttles (HTTP 429) are retried by the client's retry policy, which waits for the interval the
+# service gives in its Retry-After header, so callers fanning out requests don't need retry logic of their own.
+#
+# 1. Create several versions of a key (create_rsa_key)
+#
+# 2. List the key's versions (list_properties_of_key_versions)
+#
+# 3. Get every version concurrently with a thread pool (get_key)
+#
+# 4. Delete the key (begin_delete_key)
+# ----------------------------------------------------------------------------------------------------------
+
+VAULT_URL = os.environ["VAULT_URL"]
+MAX_CONCURRENCY = 8
+credential = DefaultAzureCredential()
+client = KeyClient(vault_url=VAULT_URL, credential=credential)
+
+key_name = "concurrentVersionsKeyName"
+print("\n.. Create several versions of a key")
+for _ in range(3):
+    key = client.create_rsa_key(key_name)
+    print(f"Created version '{key.properties.version}' of key '{key.name}'")
+
+# [START get_key_versions_concurrently]
+versions = [properties.version for properties in client.list_properties_of_key_versions(key_name)]
+
+with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY) as executor:
+    keys = list(executor.map(lambda version: client.get_key(key_name, version), versions))
+# [END get_key_versions_concurrently]
+
+for key in keys:
+    print(f"Got version '{key.properties.version}' of key '{key.name}' with type '{key.key_type}'")
+
+print("\n.. Delete the key")
+client.begin_delete_key(key_name).wait()
+print(f"Deleted key '{key_name}'")
+
+print("\nrun_sample done")
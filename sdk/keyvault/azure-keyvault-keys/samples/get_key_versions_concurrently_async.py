@@ -0,0 +1,80 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import asyncio
+import os
+
+from azure.identity.aio import DefaultAzureCredential
+from azure.keyvault.keys.aio import KeyClient
+
+# ----------------------------------------------------------------------------------------------------------
+# Prerequisites:
+# 1. An Azure Key Vault (https://learn.microsoft.com/azure/key-vault/quick-create-cli)
+#
+# 2. azure-keyvault-keys, azure-identity, and aiohttp libraries (pip install these)
+#
+# 3. Set environment variable VAULT_URL with the URL of your key vault
+#
+# 4. Set up your environment to use azure-identity's DefaultAzureCredential. For more information about how to configure
+#    the DefaultAzureCredential, refer to https://aka.ms/azsdk/python/identity/docs#azure.identity.DefaultAzureCredential
+#
+# 5. Key create, get, list, and delete permissions for your service principal in your vault
+#
+# ----------------------------------------------------------------------------------------------------------
+# Sample - demonstrates fetching every version of a key with concurrent async requests
+#
+# Listing key versions returns only their properties, and Key Vault has no multi-key GET. Fetching each version one
+# after another costs one round trip per version; with asyncio.gather the requests overlap instead. A semaphore caps
+# the number of requests in flight to stay within the vault's service limits.
+# Requests the vault throttles (HTTP 429) are retried by the client's retry policy, which waits for the interval the
+# service gives in its Retry-After header, so callers fanning out requests don't need retry logic of their own.
+#
+# 1. Create several versions of a key (create_rsa_key)
+#
+# 2. List the key's versions (list_properties_of_key_versions)
+#
+# 3. Get every version concurrently (get_key)
+#
+# 4. Delete the key (delete_key)
+# ----------------------------------------------------------------------------------------------------------
+
+MAX_CONCURRENCY = 8
+
+
+async def run_sample():
+    vault_url = os.environ["VAULT_URL"]
+    credential = DefaultAzureCredential()
+    client = KeyClient(vault_url=vault_url, credential=credential)
+
+    key_name = "concurrentVersionsKeyNameAsync"
+    print("\n.. Create several versions of a key")
+    for _ in range(3):
+        key = await client.create_rsa_key(key_name)
+        print(f"Created version '{key.properties.version}' of key '{key.name}'")
+
+    # [START get_key_versions_concurrently]
+    versions = [properties.version async for properties in client.list_properties_of_key_versions(key_name)]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def get_version(version):
+        async with semaphore:
+            return await client.get_key(key_name, version)
+
+    keys = await asyncio.gather(*(get_version(version) for version in versions))
+    # [END get_key_versions_concurrently]
+
+    for key in keys:
+        print(f"Got version '{key.properties.version}' of key '{key.name}' with type '{key.key_type}'")
+
+    print("\n.. Delete the key")
+    await client.delete_key(key_name)
+    print(f"Deleted key '{key_name}'")
+
+    print("\nrun_sample done")
+    await credential.close()
+    await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_sample())
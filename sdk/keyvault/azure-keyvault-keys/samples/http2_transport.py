@@ -0,0 +1,67 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from azure.core.experimental.transport import HttpXTransport
+from azure.identity import DefaultAzureCredential
+from azure.keyvault.keys import KeyClient
+
+# ----------------------------------------------------------------------------------------------------------
+# Prerequisites:
+# 1. An Azure Key Vault (https://learn.microsoft.com/azure/key-vault/quick-create-cli)
+#
+# 2. azure-keyvault-keys, azure-identity, azure-core-experimental, and httpx[http2] libraries (pip install these)
+#
+# 3. Set environment variable VAULT_URL with the URL of your key vault
+#
+# 4. Set up your environment to use azure-identity's DefaultAzureCredential. For more information about how to configure
+#    the DefaultAzureCredential, refer to https://aka.ms/azsdk/python/identity/docs#azure.identity.DefaultAzureCredential
+#
+# 5. Key create, get, and delete permissions for your service principal in your vault
+#
+# ----------------------------------------------------------------------------------------------------------
+# Sample - demonstrates sending a KeyClient's requests over HTTP/2
+#
+# The default transport sends each in-flight request over its own HTTP/1.1 connection. An httpx client with HTTP/2
+# enabled multiplexes concurrent requests as streams over a single TLS connection instead, so a burst of operations
+# doesn't pay for a handshake per connection.
+#
+# 1. Create an HTTP/2 httpx client and wrap it in azure-core-experimental's HttpXTransport
+#
+# 2. Create a KeyClient with the transport
+#
+# 3. Create and get keys concurrently (create_rsa_key, get_key)
+#
+# 4. Delete the keys (begin_delete_key)
+# ----------------------------------------------------------------------------------------------------------
+
+VAULT_URL = os.environ["VAULT_URL"]
+credential = DefaultAzureCredential()
+
+# [START http2_transport]
+http_client = httpx.Client(http2=True, limits=httpx.Limits(max_connections=10, max_keepalive_connections=10))
+transport = HttpXTransport(client=http_client)
+client = KeyClient(vault_url=VAULT_URL, credential=credential, transport=transport)
+# [END http2_transport]
+
+key_names = [f"http2KeyName{i}" for i in range(5)]
+with client:
+    with ThreadPoolExecutor(max_workers=len(key_names)) as executor:
+        print("\n.. Create keys concurrently")
+        for key in executor.map(client.create_rsa_key, key_names):
+            print(f"Created key '{key.name}'")
+
+        print("\n.. Get the keys concurrently")
+        for key in executor.map(client.get_key, key_names):
+            print(f"Got key '{key.name}' with type '{key.key_type}'")
+
+    print("\n.. Delete the keys")
+    for key_name in key_names:
+        client.begin_delete_key(key_name).wait()
+        print(f"Deleted key '{key_name}'")
+
+print("\nrun_sample done")
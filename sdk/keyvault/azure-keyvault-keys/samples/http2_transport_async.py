@@ -0,0 +1,73 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import asyncio
+import os
+
+import httpx
+from azure.core.experimental.transport import AsyncHttpXTransport
+from azure.identity.aio import DefaultAzureCredential
+from azure.keyvault.keys.aio import KeyClient
+
+# ----------------------------------------------------------------------------------------------------------
+# Prerequisites:
+# 1. An Azure Key Vault (https://learn.microsoft.com/azure/key-vault/quick-create-cli)
+#
+# 2. azure-keyvault-keys, azure-identity, azure-core-experimental, and httpx[http2] libraries (pip install these)
+#
+# 3. Set environment variable VAULT_URL with the URL of your key vault
+#
+# 4. Set up your environment to use azure-identity's DefaultAzureCredential. For more information about how to configure
+#    the DefaultAzureCredential, refer to https://aka.ms/azsdk/python/identity/docs#azure.identity.DefaultAzureCredential
+#
+# 5. Key create, get, and delete permissions for your service principal in your vault
+#
+# ----------------------------------------------------------------------------------------------------------
+# Sample - demonstrates sending an async KeyClient's requests over HTTP/2
+#
+# The default transport sends each in-flight request over its own HTTP/1.1 connection. An httpx client with HTTP/2
+# enabled multiplexes concurrent requests as streams over a single TLS connection instead, so a burst of operations
+# doesn't pay for a handshake per connection.
+#
+# 1. Create an HTTP/2 httpx client and wrap it in azure-core-experimental's AsyncHttpXTransport
+#
+# 2. Create a KeyClient with the transport
+#
+# 3. Create and get keys concurrently (create_rsa_key, get_key)
+#
+# 4. Delete the keys (delete_key)
+# ----------------------------------------------------------------------------------------------------------
+
+
+async def run_sample():
+    vault_url = os.environ["VAULT_URL"]
+    credential = DefaultAzureCredential()
+
+    # [START http2_transport]
+    http_client = httpx.AsyncClient(http2=True, limits=httpx.Limits(max_connections=10, max_keepalive_connections=10))
+    transport = AsyncHttpXTransport(client=http_client)
+    client = KeyClient(vault_url=vault_url, credential=credential, transport=transport)
+    # [END http2_transport]
+
+    key_names = [f"http2KeyNameAsync{i}" for i in range(5)]
+    async with client:
+        print("\n.. Create keys concurrently")
+        for key in await asyncio.gather(*(client.create_rsa_key(name) for name in key_names)):
+            print(f"Created key '{key.name}'")
+
+        print("\n.. Get the keys concurrently")
+        for key in await asyncio.gather(*(client.get_key(name) for name in key_names)):
+            print(f"Got key '{key.name}' with type '{key.key_type}'")
+
+        print("\n.. Delete the keys")
+        for key_name in key_names:
+            await client.delete_key(key_name)
+            print(f"Deleted key '{key_name}'")
+
+    print("\nrun_sample done")
+    await credential.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_sample())
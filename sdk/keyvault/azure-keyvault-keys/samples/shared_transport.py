@@ -0,0 +1,68 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from azure.core.pipeline.transport import RequestsTransport
+from azure.identity import DefaultAzureCredential
+from azure.keyvault.keys import KeyClient
+from azure.keyvault.keys.crypto import EncryptionAlgorithm
+
+# ----------------------------------------------------------------------------------------------------------
+# Prerequisites:
+# 1. Two Azure Key Vaults (https://learn.microsoft.com/azure/key-vault/quick-create-cli)
+#
+# 2. azure-keyvault-keys and azure-identity libraries (pip install these)
+#
+# 3. Set environment variables VAULT_URL and SECOND_VAULT_URL with the URLs of your key vaults
+#
+# 4. Set up your environment to use azure-identity's DefaultAzureCredential. For more information about how to configure
+#    the DefaultAzureCredential, refer to https://aka.ms/azsdk/python/identity/docs#azure.identity.DefaultAzureCredential
+#
+# 5. Key create, get, encrypt, and delete permissions for your service principal in both vaults
+#
+# ----------------------------------------------------------------------------------------------------------
+# Sample - demonstrates sharing one pooled HTTP transport between several KeyClients
+#
+# Every client creates its own connection pool by default, so each new client pays for new TCP connections and TLS
+# handshakes. Passing the same transport to every client lets them reuse warm keep-alive connections instead.
+# Cryptography clients from get_cryptography_client already share their KeyClient's pipeline.
+#
+# 1. Create a pooled transport that the clients don't own (session_owner=False)
+#
+# 2. Create a KeyClient per vault with the shared transport
+#
+# 3. Create keys and encrypt with a CryptographyClient (create_rsa_key, get_cryptography_client)
+#
+# 4. Delete the keys (begin_delete_key)
+# ----------------------------------------------------------------------------------------------------------
+
+VAULT_URLS = [os.environ["VAULT_URL"], os.environ["SECOND_VAULT_URL"]]
+credential = DefaultAzureCredential()
+
+# [START shared_transport]
+session = requests.Session()
+adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50)
+session.mount("https://", adapter)
+# session_owner=False keeps the session open when an individual client is closed
+shared_transport = RequestsTransport(session=session, session_owner=False)
+
+with shared_transport:
+    clients = [KeyClient(vault_url=url, credential=credential, transport=shared_transport) for url in VAULT_URLS]
+    for client in clients:
+        print(f"\n.. Create a key in {client.vault_url}")
+        key = client.create_rsa_key("sharedTransportKeyName")
+        crypto_client = client.get_cryptography_client(key.name, key_version=key.properties.version)
+        result = crypto_client.encrypt(EncryptionAlgorithm.rsa_oaep_256, b"plaintext")
+        print(f"Encrypted {len(result.ciphertext)} bytes with key '{key.name}'")
+
+        print("\n.. Delete the key")
+        client.begin_delete_key(key.name).wait()
+        print(f"Deleted key '{key.name}'")
+session.close()  # the transport doesn't own the session, so close it once every client is done
+# [END shared_transport]
+
+print("\nrun_sample done")
@@ -13,6 +13,7 @@ from unittest.mock import Mock, patch
 import pytest
 from azure.core.exceptions import HttpResponseError, ResourceExistsError, ResourceNotFoundError
 from azure.core.pipeline.policies import SansIOHTTPPolicy
+from azure.core.pipeline.transport._bigger_block_size_http_adapters import BiggerBlockSizeHTTPAdapter
 from azure.core.rest import HttpRequest
 from azure.keyvault.keys import (
     ApiVersion,
@@ -25,6 +26,7 @@ from azure.keyvault.keys import (
     KeyRotationPolicyAction,
     KeyType
 )
+from azure.keyvault.keys._generated.models import DeletedKeyBundle, JsonWebKey as _JsonWebKey
 from azure.keyvault.keys._generated.models import KeyRotationPolicy as _KeyRotationPolicy
 from azure.keyvault.keys._shared.client_base import DEFAULT_VERSION
 from dateutil import parser as date_parse
@@ -847,6 +849,19 @@ def test_positive_bytes_count_required():
         client.get_random_bytes(count=-1)
 
 
+def test_get_random_bytes_batch():
+    client = KeyClient("...", object())
+    with patch.object(client._client, "get_random_bytes", Mock(return_value=Mock(value=bytes(range(6))))) as get_bytes:
+        assert client.get_random_bytes_batch([1, 2, 3]) == [b"\x00", b"\x01\x02", b"\x03\x04\x05"]
+        assert get_bytes.call_count == 1
+        assert get_bytes.call_args[1]["parameters"].count == 6
+
+        for sizes in ([], [2, 0], [-1]):
+            with pytest.raises(ValueError):
+                client.get_random_bytes_batch(sizes)
+        assert get_bytes.call_count == 1
+
+
 def test_service_headers_allowed_in_logs():
     service_headers = {"x-ms-keyvault-network-info", "x-ms-keyvault-region", "x-ms-keyvault-service-version"}
     client = KeyClient("...", object())
@@ -879,3 +894,122 @@ def test_empty_rotation_policy_actions():
     assert generated_policy.lifetime_actions is None
     policy = KeyRotationPolicy._from_generated(generated_policy)
     assert policy.lifetime_actions == []
+
+
+def test_rotation_policy_cache():
+    client = KeyClient("https://vault.vault.azure.net", object())
+    with patch.object(client._client, "get_key_rotation_policy", Mock(return_value=_KeyRotationPolicy())) as get_policy:
+        policy = client.get_key_rotation_policy("key-name", cache_ttl=60)
+        policy.expires_in = "P30D"
+        # callers get their own copies of the cached policy
+        cached = client.get_key_rotation_policy("KEY-NAME", cache_ttl=60)
+        assert cached is not policy and cached.expires_in is None
+        assert get_policy.call_count == 1
+
+        # reads without cache_ttl always go to the service
+        client.get_key_rotation_policy("key-name")
+        assert get_policy.call_count == 2
+
+        client.clear_cache()
+        client.get_key_rotation_policy("key-name", cache_ttl=60)
+        assert get_policy.call_count == 3
+
+
+def test_rotation_policy_cache_ignores_response_to_request_sent_before_update():
+    client = KeyClient("https://vault.vault.azure.net", object())
+
+    def get_policy_during_update(**_):
+        # another thread updates the policy while the request is in flight
+        client.update_key_rotation_policy("key-name", KeyRotationPolicy(expires_in="P30D"))
+        return _KeyRotationPolicy()
+
+    with patch.object(client._client, "update_key_rotation_policy", Mock(return_value=_KeyRotationPolicy())):
+        with patch.object(
+            client._client, "get_key_rotation_policy", Mock(side_effect=get_policy_during_update)
+        ) as get_policy:
+            client.get_key_rotation_policy("key-name", cache_ttl=60)
+            client.get_key_rotation_policy("key-name", cache_ttl=60)
+            assert get_policy.call_count == 2
+
+
+def test_restore_key_backup_accepts_memoryview():
+    client = KeyClient("https://vault.vault.azure.net", object())
+    backup = b"\x01\x02\xff"
+    with patch.object(client._client, "restore_key", Mock(side_effect=ValueError)) as restore_key:
+        for value in (backup, bytearray(backup), memoryview(backup)):
+            with pytest.raises(ValueError):
+                client.restore_key_backup(value)
+            parameters = restore_key.call_args[1]["parameters"]
+            assert json.loads(json.dumps(parameters.as_dict())) == {"value": "AQL_"}
+
+
+def test_rotation_policy_update_cache():
+    client = KeyClient("https://vault.vault.azure.net", object())
+    policy = KeyRotationPolicy(expires_in="P90D")
+    with patch.object(
+        client._client, "update_key_rotation_policy", Mock(return_value=_KeyRotationPolicy())
+    ) as update_policy:
+        updated = client.update_key_rotation_policy("key-name", policy, cache_ttl=60)
+        cached = client.update_key_rotation_policy("KEY-NAME", policy, cache_ttl=60)
+        assert cached is not updated and cached.expires_in == updated.expires_in
+        assert update_policy.call_count == 1
+
+        # a different policy, or an update without cache_ttl, is always sent
+        client.update_key_rotation_policy("key-name", policy, expires_in="P30D", cache_ttl=60)
+        assert update_policy.call_count == 2
+        client.update_key_rotation_policy("key-name", policy)
+        assert update_policy.call_count == 3
+
+        # updates through the client discard the record of what was sent
+        client.update_key_rotation_policy("key-name", policy, cache_ttl=60)
+        assert update_policy.call_count == 4
+
+
+def test_default_transport_connection_pool_size():
+    client = KeyClient("https://vault.vault.azure.net", object(), connection_pool_size=42)
+    transport = client._client._client._pipeline._transport
+    adapter = transport.session.get_adapter("https://vault.vault.azure.net")
+    # the session keeps the adapter azure-core's transport mounts by default
+    assert isinstance(adapter, BiggerBlockSizeHTTPAdapter)
+    assert adapter._pool_maxsize == 42
+
+
+def _deleted_key_response(recovery_id=None):
+    """Return a fake transport, and a delete_key response whose pipeline context holds that transport."""
+    transport = Mock()
+    bundle = DeletedKeyBundle(
+        key=_JsonWebKey(kid="https://vault.vault.azure.net/keys/key-name/version"), recovery_id=recovery_id
+    )
+    return transport, (Mock(context=Mock(transport=transport)), bundle)
+
+
+@pytest.mark.parametrize(
+    "polling_interval,expected_sleeps",
+    [(None, [0.1, 0.2, 0.4, 0.8, 1.6, 2, 2]), (5, [5] * 7)],
+)
+def test_delete_key_polling_intervals(polling_interval, expected_sleeps):
+    client = KeyClient("https://vault.vault.azure.net", object())
+    transport, response = _deleted_key_response("https://vault.vault.azure.net/deletedkeys/key-name")
+    not_found = [ResourceNotFoundError("not deleted yet")] * len(expected_sleeps)
+    kwargs = {} if polling_interval is None else {"_polling_interval": polling_interval}
+    with patch.object(client._client, "delete_key", Mock(return_value=response)), patch.object(
+        client._client, "get_deleted_key", Mock(side_effect=not_found + [response[1]])
+    ):
+        client.begin_delete_key("key-name", **kwargs).wait()
+    assert [sleep.args[0] for sleep in transport.sleep.call_args_list] == expected_sleeps
+
+
+def test_delete_key_without_recovery_id_does_not_poll():
+    client = KeyClient("https://vault.vault.azure.net", object())
+    transport, response = _deleted_key_response()
+    get_deleted_key = Mock()
+    with patch.object(client._client, "delete_key", Mock(return_value=response)), patch.object(
+        client._client, "get_deleted_key", get_deleted_key
+    ):
+        poller = client.begin_delete_key("key-name")
+        assert poller.done()
+        deleted_key = poller.result()
+    assert deleted_key.name == "key-name"
+    assert deleted_key.recovery_id is None
+    assert not get_deleted_key.called
+    assert not transport.sleep.called
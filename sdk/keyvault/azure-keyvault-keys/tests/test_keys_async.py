@@ -9,7 +9,7 @@ import functools
 import json
 import logging
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from azure.core.exceptions import HttpResponseError, ResourceExistsError, ResourceNotFoundError
 from azure.core.pipeline.policies import SansIOHTTPPolicy
@@ -24,6 +24,8 @@ from azure.keyvault.keys import (
     KeyRotationPolicyAction,
 )
 from azure.keyvault.keys.aio import KeyClient
+from azure.keyvault.keys._generated.models import DeletedKeyBundle, JsonWebKey as _JsonWebKey, KeyBundle
+from azure.keyvault.keys._generated.models import KeyRotationPolicy as _KeyRotationPolicy
 from azure.keyvault.keys._shared.client_base import DEFAULT_VERSION
 import pytest
 
@@ -891,3 +893,162 @@ def test_custom_hook_policy():
 
     client = KeyClient("...", object(), custom_hook_policy=CustomHookPolicy())
     assert isinstance(client._client._config.custom_hook_policy, CustomHookPolicy)
+
+
+@pytest.mark.asyncio
+async def test_rotation_policy_cache():
+    client = KeyClient("https://vault.vault.azure.net", object())
+    with patch.object(
+        client._client, "get_key_rotation_policy", AsyncMock(return_value=_KeyRotationPolicy())
+    ) as get_policy:
+        policy = await client.get_key_rotation_policy("key-name", cache_ttl=60)
+        policy.expires_in = "P30D"
+        # callers get their own copies of the cached policy
+        cached = await client.get_key_rotation_policy("KEY-NAME", cache_ttl=60)
+        assert cached is not policy and cached.expires_in is None
+        assert get_policy.await_count == 1
+
+        # reads without cache_ttl always go to the service
+        await client.get_key_rotation_policy("key-name")
+        assert get_policy.await_count == 2
+
+        client.clear_cache()
+        await client.get_key_rotation_policy("key-name", cache_ttl=60)
+        assert get_policy.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_rotation_policy_cache_ignores_response_to_request_sent_before_update():
+    client = KeyClient("https://vault.vault.azure.net", object())
+    release = asyncio.Event()
+
+    async def get_policy(**_):
+        await release.wait()
+        return _KeyRotationPolicy()
+
+    with patch.object(client._client, "update_key_rotation_policy", AsyncMock(return_value=_KeyRotationPolicy())):
+        with patch.object(client._client, "get_key_rotation_policy", AsyncMock(side_effect=get_policy)) as mock_get:
+            in_flight = asyncio.ensure_future(client.get_key_rotation_policy("key-name", cache_ttl=60))
+            await asyncio.sleep(0)
+            await client.update_key_rotation_policy("key-name", KeyRotationPolicy(expires_in="P30D"))
+            release.set()
+            await in_flight
+            await client.get_key_rotation_policy("key-name", cache_ttl=60)
+            assert mock_get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_key_attestation_cache():
+    client = KeyClient("https://vault.vault.azure.net", object())
+    bundle = KeyBundle(
+        key=_JsonWebKey(kid="https://vault.vault.azure.net/keys/key-name/version", kty="RSA"), tags={"env": "test"}
+    )
+    with patch.object(client._client, "get_key_attestation", AsyncMock(return_value=bundle)) as get_attestation:
+        key = await client.get_key_attestation("key-name", cache_ttl=60)
+        key.properties.tags["key"] = "value"
+        # callers get their own copies of the cached key
+        cached = await client.get_key_attestation("KEY-NAME", cache_ttl=60)
+        assert cached is not key and cached.properties.tags == {"env": "test"}
+        assert get_attestation.await_count == 1
+
+        # each version is cached separately
+        await client.get_key_attestation("key-name", "version", cache_ttl=60)
+        assert get_attestation.await_count == 2
+
+        # changing the key discards its cached attestations
+        with patch.object(client._client, "update_key", AsyncMock(return_value=bundle)):
+            await client.update_key_properties("key-name", enabled=False)
+        await client.get_key_attestation("key-name", cache_ttl=60)
+        assert get_attestation.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_restore_key_backup_accepts_memoryview():
+    client = KeyClient("https://vault.vault.azure.net", object())
+    backup = b"\x01\x02\xff"
+    with patch.object(client._client, "restore_key", AsyncMock(side_effect=ValueError)) as restore_key:
+        for value in (backup, bytearray(backup), memoryview(backup)):
+            with pytest.raises(ValueError):
+                await client.restore_key_backup(value)
+            parameters = restore_key.call_args[1]["parameters"]
+            assert json.loads(json.dumps(parameters.as_dict())) == {"value": "AQL_"}
+
+
+@pytest.mark.asyncio
+async def test_rotation_policy_update_cache():
+    client = KeyClient("https://vault.vault.azure.net", object())
+    policy = KeyRotationPolicy(expires_in="P90D")
+    with patch.object(
+        client._client, "update_key_rotation_policy", AsyncMock(return_value=_KeyRotationPolicy())
+    ) as update_policy:
+        updated = await client.update_key_rotation_policy("key-name", policy, cache_ttl=60)
+        cached = await client.update_key_rotation_policy("KEY-NAME", policy, cache_ttl=60)
+        assert cached is not updated and cached.expires_in == updated.expires_in
+        assert update_policy.await_count == 1
+
+        # a different policy, or an update without cache_ttl, is always sent
+        await client.update_key_rotation_policy("key-name", policy, expires_in="P30D", cache_ttl=60)
+        assert update_policy.await_count == 2
+        await client.update_key_rotation_policy("key-name", policy)
+        assert update_policy.await_count == 3
+
+        # updates through the client discard the record of what was sent
+        await client.update_key_rotation_policy("key-name", policy, cache_ttl=60)
+        assert update_policy.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_get_random_bytes_batch():
+    client = KeyClient("...", object())
+    with patch.object(
+        client._client, "get_random_bytes", AsyncMock(return_value=Mock(value=bytes(range(6))))
+    ) as get_bytes:
+        assert await client.get_random_bytes_batch([1, 2, 3]) == [b"\x00", b"\x01\x02", b"\x03\x04\x05"]
+        assert get_bytes.await_count == 1
+        assert get_bytes.call_args[1]["parameters"].count == 6
+
+        for sizes in ([], [2, 0], [-1]):
+            with pytest.raises(ValueError):
+                await client.get_random_bytes_batch(sizes)
+        assert get_bytes.await_count == 1
+
+
+def _deleted_key_response(recovery_id=None):
+    """Return a fake transport, and a delete_key response whose pipeline context holds that transport."""
+    transport = Mock(sleep=AsyncMock())
+    bundle = DeletedKeyBundle(
+        key=_JsonWebKey(kid="https://vault.vault.azure.net/keys/key-name/version"), recovery_id=recovery_id
+    )
+    return transport, (Mock(context=Mock(transport=transport)), bundle)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "polling_interval,expected_sleeps",
+    [(None, [0.1, 0.2, 0.4, 0.8, 1.6, 2, 2]), (5, [5] * 7)],
+)
+async def test_delete_key_polling_intervals(polling_interval, expected_sleeps):
+    client = KeyClient("https://vault.vault.azure.net", object())
+    transport, response = _deleted_key_response("https://vault.vault.azure.net/deletedkeys/key-name")
+    not_found = [ResourceNotFoundError("not deleted yet")] * len(expected_sleeps)
+    kwargs = {} if polling_interval is None else {"_polling_interval": polling_interval}
+    with patch.object(client._client, "delete_key", AsyncMock(return_value=response)), patch.object(
+        client._client, "get_deleted_key", AsyncMock(side_effect=not_found + [response[1]])
+    ):
+        await client.delete_key("key-name", **kwargs)
+    assert [sleep.args[0] for sleep in transport.sleep.await_args_list] == expected_sleeps
+
+
+@pytest.mark.asyncio
+async def test_delete_key_without_recovery_id_does_not_poll():
+    client = KeyClient("https://vault.vault.azure.net", object())
+    transport, response = _deleted_key_response()
+    get_deleted_key = AsyncMock()
+    with patch.object(client._client, "delete_key", AsyncMock(return_value=response)), patch.object(
+        client._client, "get_deleted_key", get_deleted_key
+    ):
+        deleted_key = await client.delete_key("key-name")
+    assert deleted_key.name == "key-name"
+    assert deleted_key.recovery_id is None
+    assert not get_deleted_key.called
+    assert not transport.sleep.called
@@ -3,8 +3,9 @@
 # Licensed under the MIT License.
 # ------------------------------------
 from datetime import datetime
-from functools import partial
-from typing import Any, cast, Dict, Optional
+from functools import cached_property, lru_cache, partial
+from itertools import repeat
+from typing import Any, Callable, cast, Dict, Optional
 
 from azure.core.paging import ItemPaged
 from azure.core.polling import LROPoller
@@ -12,7 +13,15 @@ from azure.core.tracing.decorator import distributed_trace
 
 from ._models import KeyVaultSecret, DeletedSecret, SecretProperties
 from ._shared import KeyVaultClientBase
-from ._shared._polling import DeleteRecoverPollingMethod, KeyVaultOperationPoller
+from ._shared._polling import adaptive_polling_interval, DeleteRecoverPollingMethod, KeyVaultOperationPoller
+
+
+def _deleted_secret_items(objs):
+    return map(DeletedSecret._from_deleted_secret_item, objs)  # pylint:disable=protected-access
+
+
+def _secret_properties_items(objs):
+    return map(SecretProperties._from_secret_item, objs)  # pylint:disable=protected-access
 
 
 class SecretClient(KeyVaultClientBase):
@@ -41,6 +50,17 @@ class SecretClient(KeyVaultClientBase):
 
     # pylint:disable=protected-access
 
+    @cached_property
+    def _secret_attributes(self) -> Callable[[Optional[bool], Optional[datetime], Optional[datetime]], Any]:
+        # calls with equal attributes share one model, which is safe because models are only serialized, never modified
+        model = self._models.SecretAttributes
+
+        @lru_cache(maxsize=64)
+        def build(enabled: Optional[bool], not_before: Optional[datetime], expires_on: Optional[datetime]) -> Any:
+            return model(enabled=enabled, not_before=not_before, expires=expires_on)
+
+        return build
+
     @distributed_trace
     def get_secret(self, name: str, version: Optional[str] = None, **kwargs: Any) -> KeyVaultSecret:
         """Get a secret. Requires the secrets/get permission.
@@ -111,9 +131,7 @@ class SecretClient(KeyVaultClientBase):
 
         """
         if enabled is not None or not_before is not None or expires_on is not None:
-            attributes = self._models.SecretAttributes(
-                enabled=enabled, not_before=not_before, expires=expires_on
-            )
+            attributes = self._secret_attributes(enabled, not_before, expires_on)
         else:
             attributes = None
 
@@ -175,9 +193,7 @@ class SecretClient(KeyVaultClientBase):
 
         """
         if enabled is not None or not_before is not None or expires_on is not None:
-            attributes = self._models.SecretAttributes(
-                enabled=enabled, not_before=not_before, expires=expires_on
-            )
+            attributes = self._secret_attributes(enabled, not_before, expires_on)
         else:
             attributes = None
 
@@ -196,11 +212,15 @@ class SecretClient(KeyVaultClientBase):
         return SecretProperties._from_secret_bundle(bundle)  # pylint: disable=protected-access
 
     @distributed_trace
-    def list_properties_of_secrets(self, **kwargs: Any) -> ItemPaged[SecretProperties]:
+    def list_properties_of_secrets(
+        self, *, max_page_size: Optional[int] = None, **kwargs: Any
+    ) -> ItemPaged[SecretProperties]:
         """List identifiers and attributes of all secrets in the vault. Requires secrets/list permission.
 
         List items don't include secret values. Use :func:`get_secret` to get a secret's value.
 
+        :keyword int max_page_size: The maximum number of items in each page of results. The service may return fewer.
+
         :returns: An iterator of secrets, excluding their values
         :rtype: ~azure.core.paging.ItemPaged[~azure.keyvault.secrets.SecretProperties]
 
@@ -214,19 +234,23 @@ class SecretClient(KeyVaultClientBase):
 
         """
         return self._client.get_secrets(
-            maxresults=kwargs.pop("max_page_size", None),
-            cls=lambda objs: [SecretProperties._from_secret_item(x) for x in objs],
+            maxresults=max_page_size,
+            cls=_secret_properties_items,
             **kwargs
         )
 
     @distributed_trace
-    def list_properties_of_secret_versions(self, name: str, **kwargs: Any) -> ItemPaged[SecretProperties]:
+    def list_properties_of_secret_versions(
+        self, name: str, *, max_page_size: Optional[int] = None, **kwargs: Any
+    ) -> ItemPaged[SecretProperties]:
         """List properties of all versions of a secret, excluding their values. Requires secrets/list permission.
 
         List items don't include secret values. Use :func:`get_secret` to get a secret's value.
 
         :param str name: Name of the secret
 
+        :keyword int max_page_size: The maximum number of items in each page of results. The service may return fewer.
+
         :returns: An iterator of secrets, excluding their values
         :rtype: ~azure.core.paging.ItemPaged[~azure.keyvault.secrets.SecretProperties]
 
@@ -241,8 +265,8 @@ class SecretClient(KeyVaultClientBase):
         """
         return self._client.get_secret_versions(
             name,
-            maxresults=kwargs.pop("max_page_size", None),
-            cls=lambda objs: [SecretProperties._from_secret_item(x) for x in objs],
+            maxresults=max_page_size,
+            cls=_secret_properties_items,
             **kwargs
         )
 
@@ -326,8 +350,7 @@ class SecretClient(KeyVaultClientBase):
 
         """
         polling_interval = kwargs.pop("_polling_interval", None)
-        if polling_interval is None:
-            polling_interval = 2
+        intervals = adaptive_polling_interval() if polling_interval is None else repeat(polling_interval)
         # Ignore pyright warning about return type not being iterable because we use `cls` to return a tuple
         pipeline_response, deleted_secret_bundle = self._client.delete_secret(
             secret_name=name,
@@ -343,7 +366,7 @@ class SecretClient(KeyVaultClientBase):
             pipeline_response=pipeline_response,
             command=command,
             final_resource=deleted_secret,
-            interval=polling_interval,
+            interval_generator=intervals,
         )
         return KeyVaultOperationPoller(polling_method)
 
@@ -372,11 +395,13 @@ class SecretClient(KeyVaultClientBase):
         return DeletedSecret._from_deleted_secret_bundle(bundle)
 
     @distributed_trace
-    def list_deleted_secrets(self, **kwargs: Any) -> ItemPaged[DeletedSecret]:
+    def list_deleted_secrets(self, *, max_page_size: Optional[int] = None, **kwargs: Any) -> ItemPaged[DeletedSecret]:
         """Lists all deleted secrets. Possible only in vaults with soft-delete enabled.
 
         Requires secrets/list permission.
 
+        :keyword int max_page_size: The maximum number of items in each page of results. The service may return fewer.
+
         :returns: An iterator of deleted secrets, excluding their values
         :rtype: ~azure.core.paging.ItemPaged[~azure.keyvault.secrets.DeletedSecret]
 
@@ -390,8 +415,8 @@ class SecretClient(KeyVaultClientBase):
 
         """
         return self._client.get_deleted_secrets(
-            maxresults=kwargs.pop("max_page_size", None),
-            cls=lambda objs: [DeletedSecret._from_deleted_secret_item(x) for x in objs],
+            maxresults=max_page_size,
+            cls=_deleted_secret_items,
             **kwargs
         )
 
@@ -453,8 +478,7 @@ class SecretClient(KeyVaultClientBase):
 
         """
         polling_interval = kwargs.pop("_polling_interval", None)
-        if polling_interval is None:
-            polling_interval = 2
+        intervals = adaptive_polling_interval() if polling_interval is None else repeat(polling_interval)
         # Ignore pyright warning about return type not being iterable because we use `cls` to return a tuple
         pipeline_response, recovered_secret_bundle = self._client.recover_deleted_secret(
             secret_name=name,
@@ -469,7 +493,7 @@ class SecretClient(KeyVaultClientBase):
             pipeline_response=pipeline_response,
             command=command,
             final_resource=recovered_secret,
-            interval=polling_interval,
+            interval_generator=intervals,
         )
         return KeyVaultOperationPoller(polling_method)
 
@@ -13,6 +13,8 @@ from ._shared import parse_key_vault_id
 class SecretProperties(object):
     """A secret's ID and attributes."""
 
+    __slots__ = ("_attributes", "_id", "_vault_id", "_content_type", "_key_id", "_managed", "_tags")
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self._attributes: Optional[_models.SecretAttributes] = args[0] if args else kwargs.get("attributes", None)
         self._id: Optional[str] = args[1] if len(args) > 1 else kwargs.get("vault_id", None)
@@ -197,6 +199,8 @@ class KeyVaultSecret(object):
     :type value: str or None
     """
 
+    __slots__ = ("_properties", "_value")
+
     def __init__(self, properties: SecretProperties, value: Optional[str]) -> None:
         self._properties = properties
         self._value = value
@@ -264,6 +268,8 @@ class KeyVaultSecretIdentifier(object):
             :dedent: 8
     """
 
+    __slots__ = ("_resource_id",)
+
     def __init__(self, source_id: str) -> None:
         self._resource_id = parse_key_vault_id(source_id)
 
@@ -299,6 +305,8 @@ class DeletedSecret(object):
     :type scheduled_purge_date: ~datetime.datetime or None
     """
 
+    __slots__ = ("_properties", "_deleted_date", "_recovery_id", "_scheduled_purge_date")
+
     def __init__(
         self,
         properties: SecretProperties,
@@ -5,7 +5,7 @@
 import logging
 import threading
 import uuid
-from typing import Any, Callable, cast, Optional
+from typing import Any, Callable, cast, Iterator, Optional
 
 from azure.core.exceptions import ResourceNotFoundError, HttpResponseError
 from azure.core.pipeline import PipelineResponse
@@ -18,6 +18,26 @@ from azure.core.tracing.common import with_current_context
 logger = logging.getLogger(__name__)
 
 
+def adaptive_polling_interval(initial: float = 0.1, maximum: float = 2) -> Iterator[float]:
+    """Yield polling intervals which double from ``initial`` until they reach ``maximum``, then stay there.
+
+    Deletion and recovery usually complete within a few seconds, so polling soon after the request and backing off
+    finds a completed operation sooner than a fixed interval does.
+
+    :param float initial: The first interval, in seconds.
+    :param float maximum: The longest interval, in seconds.
+
+    :returns: An endless iterator of polling intervals
+    :rtype: Iterator[float]
+    """
+    interval = initial
+    while interval < maximum:
+        yield interval
+        interval *= 2
+    while True:
+        yield maximum
+
+
 class KeyVaultOperationPoller(LROPoller):
     """Poller for long running operations where calling result() doesn't wait for operation to complete.
 
@@ -88,6 +108,8 @@ class DeleteRecoverPollingMethod(PollingMethod):
     :type final_resource: Any
     :param bool finished: Whether or not the polling operation is completed.
     :param int interval: The polling interval, in seconds.
+    :param interval_generator: Intervals to wait between polls, in seconds. Overrides ``interval`` when provided.
+    :type interval_generator: Iterator[float] or None
     """
     def __init__(
             self,
@@ -95,12 +117,14 @@ class DeleteRecoverPollingMethod(PollingMethod):
             command: Callable,
             final_resource: Any,
             finished: bool,
-            interval: int = 2
+            interval: int = 2,
+            interval_generator: Optional[Iterator[float]] = None,
         ) -> None:
         self._pipeline_response = pipeline_response
         self._command = command
         self._resource = final_resource
         self._polling_interval = interval
+        self._intervals = interval_generator
         self._finished = finished
 
     def _update_status(self) -> None:
@@ -127,11 +151,14 @@ class DeleteRecoverPollingMethod(PollingMethod):
                 if not self.finished():
                     # We should always ask the client's transport to sleep, instead of sleeping directly
                     transport: HttpTransport = cast(HttpTransport, self._pipeline_response.context.transport)
-                    transport.sleep(self._polling_interval)
+                    transport.sleep(self._next_interval())
         except Exception as e:
             logger.warning(str(e))
             raise
 
+    def _next_interval(self) -> float:
+        return self._polling_interval if self._intervals is None else next(self._intervals)
+
     def finished(self) -> bool:
         return self._finished
 
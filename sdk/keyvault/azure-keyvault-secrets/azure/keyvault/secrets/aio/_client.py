@@ -2,17 +2,91 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+import asyncio
+from copy import deepcopy
 from datetime import datetime
-from typing import Any, cast, Dict, Optional
-from functools import partial
+from typing import Any, AsyncIterator, Callable, cast, Dict, Optional, Tuple, TypeVar
+from functools import cached_property, lru_cache, partial
+from itertools import repeat
 
+from azure.core.credentials_async import AsyncTokenCredential
 from azure.core.tracing.decorator import distributed_trace
 from azure.core.tracing.decorator_async import distributed_trace_async
-from azure.core.async_paging import AsyncItemPaged
+from azure.core.async_paging import AsyncItemPaged, AsyncPageIterator
 
+from .._client import _deleted_secret_items, _secret_properties_items
 from .._models import KeyVaultSecret, DeletedSecret, SecretProperties
 from .._shared import AsyncKeyVaultClientBase
+from .._shared._polling import adaptive_polling_interval
 from .._shared._polling_async import AsyncDeleteRecoverPollingMethod
+from .._shared.response_cache import ResponseCache
+
+ReturnType = TypeVar("ReturnType")
+
+
+def _retrieve_exception(fetch: "asyncio.Future[Any]") -> None:
+    # retrieve the exception of a prefetch the caller never awaits, so asyncio doesn't log it as unhandled
+    if not fetch.cancelled():
+        fetch.exception()
+
+
+class _PrefetchingAsyncPageIterator(AsyncIterator[AsyncIterator[ReturnType]]):
+    """An async page iterator that requests each next page while the caller consumes the current one.
+
+    :param pages: The page iterator to prefetch from.
+    :type pages: ~azure.core.async_paging.AsyncPageIterator
+    """
+
+    def __init__(self, pages: AsyncPageIterator[ReturnType]) -> None:
+        self._pages = pages
+        self._prefetched: "Optional[asyncio.Future[AsyncIterator[ReturnType]]]" = None
+        # the token of the page after the last one returned, which the wrapped iterator has already moved past
+        self.continuation_token = pages.continuation_token
+
+    async def __anext__(self) -> AsyncIterator[ReturnType]:
+        prefetched, self._prefetched = self._prefetched, None
+        page = await (prefetched if prefetched is not None else self._pages.__anext__())
+        self.continuation_token = self._pages.continuation_token
+        if self.continuation_token is not None:
+            self._prefetched = asyncio.ensure_future(self._pages.__anext__())
+            self._prefetched.add_done_callback(_retrieve_exception)
+        return page
+
+    async def aclose(self) -> None:
+        """Cancel the request for the next page, if one is in flight."""
+        self._cancel_prefetch()
+
+    def _cancel_prefetch(self) -> None:
+        prefetched, self._prefetched = self._prefetched, None
+        if prefetched is not None:
+            prefetched.cancel()
+
+    def __del__(self) -> None:
+        try:
+            self._cancel_prefetch()
+        except RuntimeError:
+            # the event loop is closed, so the request can't continue anyway
+            pass
+
+
+class _PrefetchingAsyncItemPaged(AsyncItemPaged[ReturnType]):
+    """An async pager whose page iterators request each next page while the caller consumes the current one.
+
+    :param paged: The pager to prefetch from.
+    :type paged: ~azure.core.async_paging.AsyncItemPaged
+    """
+
+    def __init__(self, paged: AsyncItemPaged[ReturnType]) -> None:
+        super().__init__()
+        self._paged = paged
+
+    def by_page(self, continuation_token: Optional[str] = None) -> _PrefetchingAsyncPageIterator[ReturnType]:
+        return _PrefetchingAsyncPageIterator(cast(AsyncPageIterator, self._paged.by_page(continuation_token)))
+
+    async def aclose(self) -> None:
+        """Cancel the request for the next page, if one is in flight."""
+        if isinstance(self._page_iterator, _PrefetchingAsyncPageIterator):
+            await self._page_iterator.aclose()
 
 
 class SecretClient(AsyncKeyVaultClientBase):
@@ -29,6 +103,14 @@ class SecretClient(AsyncKeyVaultClientBase):
     :paramtype api_version: ~azure.keyvault.secrets.ApiVersion or str
     :keyword bool verify_challenge_resource: Whether to verify the authentication challenge resource matches the Key
         Vault domain. Defaults to True.
+    :keyword secret_cache_ttl: If set, :func:`get_secret` returns a secret this client fetched no more than
+        ``secret_cache_ttl`` seconds ago instead of requesting it again. Secrets are not cached by default. Setting,
+        updating, deleting, recovering, purging or restoring a secret through this client discards its cached versions.
+    :paramtype secret_cache_ttl: float or None
+    :keyword int secret_cache_maxsize: The maximum number of secret versions to cache, evicting the least recently used
+        first. Defaults to 128.
+
+    Concurrent :func:`get_secret` calls for the same secret version share a single request to the vault.
 
     Example:
         .. literalinclude:: ../tests/test_samples_secrets_async.py
@@ -41,6 +123,56 @@ class SecretClient(AsyncKeyVaultClientBase):
 
     # pylint:disable=protected-access
 
+    def __init__(
+        self,
+        vault_url: str,
+        credential: AsyncTokenCredential,
+        *,
+        secret_cache_ttl: Optional[float] = None,
+        secret_cache_maxsize: int = 128,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(vault_url, credential, **kwargs)
+        self._secret_cache_ttl = secret_cache_ttl
+        self._secret_cache = ResponseCache(maxsize=secret_cache_maxsize)
+        # in-flight get_secret requests, shared by concurrent callers asking for the same secret version
+        self._secret_fetches: "Dict[Tuple[str, str], asyncio.Future[KeyVaultSecret]]" = {}
+        # the number of callers awaiting each in-flight request, which is cancelled when none are left
+        self._fetch_waiters: "Dict[asyncio.Future[KeyVaultSecret], int]" = {}
+
+    def _forget_cached(self, name: str) -> None:
+        name = name.lower()
+        self._secret_cache.discard_group(name)
+        # later callers shouldn't join a request that may have been sent before the change
+        for cache_key in [cache_key for cache_key in self._secret_fetches if cache_key[0] == name]:
+            del self._secret_fetches[cache_key]
+
+    async def _fetch_secret(
+        self, cache_key: Tuple[str, str], generation: int, name: str, version: Optional[str], **kwargs: Any
+    ) -> KeyVaultSecret:
+        bundle = await self._client.get_secret(name, version or "", **kwargs)
+        secret = KeyVaultSecret._from_secret_bundle(bundle)
+        if self._secret_cache_ttl:
+            self._secret_cache.set(cache_key, deepcopy(secret), cache_key[0], generation)
+        return secret
+
+    def _end_fetch(self, cache_key: Tuple[str, str], fetch: "asyncio.Future[KeyVaultSecret]") -> None:
+        if self._secret_fetches.get(cache_key) is fetch:
+            del self._secret_fetches[cache_key]
+        del self._fetch_waiters[fetch]
+        _retrieve_exception(fetch)
+
+    @cached_property
+    def _secret_attributes(self) -> Callable[[Optional[bool], Optional[datetime], Optional[datetime]], Any]:
+        # calls with equal attributes share one model, which is safe because models are only serialized, never modified
+        model = self._models.SecretAttributes
+
+        @lru_cache(maxsize=64)
+        def build(enabled: Optional[bool], not_before: Optional[datetime], expires_on: Optional[datetime]) -> Any:
+            return model(enabled=enabled, not_before=not_before, expires=expires_on)
+
+        return build
+
     @distributed_trace_async
     async def get_secret(self, name: str, version: Optional[str] = None, **kwargs: Any) -> KeyVaultSecret:
         """Get a secret. Requires the secrets/get permission.
@@ -62,8 +194,35 @@ class SecretClient(AsyncKeyVaultClientBase):
                 :caption: Get a secret
                 :dedent: 8
         """
-        bundle = await self._client.get_secret(name, version or "", **kwargs)
-        return KeyVaultSecret._from_secret_bundle(bundle)
+        cache_key = (name.lower(), version or "")
+        if self._secret_cache_ttl:
+            cached = self._secret_cache.get(cache_key, self._secret_cache_ttl)
+            if cached is not None:
+                # callers get copies, so one modifying its secret can't change what the next is given
+                return deepcopy(cached)
+
+        # the secret may change before the response arrives, which then mustn't be cached
+        generation = self._secret_cache.generation()
+        if kwargs:
+            # per-call options can change the request, so it isn't shared with other callers
+            return await self._fetch_secret(cache_key, generation, name, version, **kwargs)
+
+        fetch = self._secret_fetches.get(cache_key)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._fetch_secret(cache_key, generation, name, version))
+            self._secret_fetches[cache_key] = fetch
+            self._fetch_waiters[fetch] = 0
+            fetch.add_done_callback(partial(self._end_fetch, cache_key))
+        self._fetch_waiters[fetch] += 1
+        try:
+            # shielded so that one caller's cancellation doesn't cancel the request for the others
+            return deepcopy(await asyncio.shield(fetch))
+        except asyncio.CancelledError:
+            if not fetch.done():
+                self._fetch_waiters[fetch] -= 1
+                if not self._fetch_waiters[fetch]:
+                    fetch.cancel()
+            raise
 
     @distributed_trace_async
     async def set_secret(
@@ -106,7 +265,7 @@ class SecretClient(AsyncKeyVaultClientBase):
                 :dedent: 8
         """
         if enabled is not None or not_before is not None or expires_on is not None:
-            attributes = self._models.SecretAttributes(enabled=enabled, not_before=not_before, expires=expires_on)
+            attributes = self._secret_attributes(enabled, not_before, expires_on)
         else:
             attributes = None
 
@@ -122,6 +281,7 @@ class SecretClient(AsyncKeyVaultClientBase):
             parameters=parameters,
             **kwargs
         )
+        self._forget_cached(name)
         return KeyVaultSecret._from_secret_bundle(bundle)
 
     @distributed_trace_async
@@ -167,7 +327,7 @@ class SecretClient(AsyncKeyVaultClientBase):
                 :dedent: 8
         """
         if enabled is not None or not_before is not None or expires_on is not None:
-            attributes = self._models.SecretAttributes(enabled=enabled, not_before=not_before, expires=expires_on)
+            attributes = self._secret_attributes(enabled, not_before, expires_on)
         else:
             attributes = None
 
@@ -183,14 +343,22 @@ class SecretClient(AsyncKeyVaultClientBase):
             parameters=parameters,
             **kwargs
         )
+        self._forget_cached(name)
         return SecretProperties._from_secret_bundle(bundle)  # pylint: disable=protected-access
 
     @distributed_trace
-    def list_properties_of_secrets(self, **kwargs: Any) -> AsyncItemPaged[SecretProperties]:
+    def list_properties_of_secrets(
+        self, *, max_page_size: Optional[int] = None, prefetch_next_page: bool = False, **kwargs: Any
+    ) -> AsyncItemPaged[SecretProperties]:
         """List identifiers and attributes of all secrets in the vault. Requires secrets/list permission.
 
         List items don't include secret values. Use :func:`get_secret` to get a secret's value.
 
+        :keyword int max_page_size: The maximum number of items in each page of results. The service may return fewer.
+        :keyword bool prefetch_next_page: Whether to request each next page of results while the current page is
+            being consumed, which hides the latency of page requests from callers that process items quickly. If
+            iteration stops early, one extra page may have been requested. Defaults to False.
+
         :returns: An iterator of secrets
         :rtype: ~azure.core.async_paging.AsyncItemPaged[~azure.keyvault.secrets.SecretProperties]
 
@@ -202,20 +370,28 @@ class SecretClient(AsyncKeyVaultClientBase):
                 :caption: Lists all secrets
                 :dedent: 8
         """
-        return self._client.get_secrets(
-            maxresults=kwargs.pop("max_page_size", None),
-            cls=lambda objs: [SecretProperties._from_secret_item(x) for x in objs],
+        paged = self._client.get_secrets(
+            maxresults=max_page_size,
+            cls=_secret_properties_items,
             **kwargs
         )
+        return _PrefetchingAsyncItemPaged(paged) if prefetch_next_page else paged
 
     @distributed_trace
-    def list_properties_of_secret_versions(self, name: str, **kwargs: Any) -> AsyncItemPaged[SecretProperties]:
+    def list_properties_of_secret_versions(
+        self, name: str, *, max_page_size: Optional[int] = None, prefetch_next_page: bool = False, **kwargs: Any
+    ) -> AsyncItemPaged[SecretProperties]:
         """List properties of all versions of a secret, excluding their values. Requires secrets/list permission.
 
         List items don't include secret values. Use :func:`get_secret` to get a secret's value.
 
         :param str name: Name of the secret
 
+        :keyword int max_page_size: The maximum number of items in each page of results. The service may return fewer.
+        :keyword bool prefetch_next_page: Whether to request each next page of results while the current page is
+            being consumed, which hides the latency of page requests from callers that process items quickly. If
+            iteration stops early, one extra page may have been requested. Defaults to False.
+
         :returns: An iterator of secrets, excluding their values
         :rtype: ~azure.core.async_paging.AsyncItemPaged[~azure.keyvault.secrets.SecretProperties]
 
@@ -227,12 +403,13 @@ class SecretClient(AsyncKeyVaultClientBase):
                 :caption: List all versions of a secret
                 :dedent: 8
         """
-        return self._client.get_secret_versions(
+        paged = self._client.get_secret_versions(
             name,
-            maxresults=kwargs.pop("max_page_size", None),
-            cls=lambda objs: [SecretProperties._from_secret_item(x) for x in objs],
+            maxresults=max_page_size,
+            cls=_secret_properties_items,
             **kwargs
         )
+        return _PrefetchingAsyncItemPaged(paged) if prefetch_next_page else paged
 
     @distributed_trace_async
     async def backup_secret(self, name: str, **kwargs: Any) -> bytes:
@@ -281,7 +458,10 @@ class SecretClient(AsyncKeyVaultClientBase):
             parameters=self._models.SecretRestoreParameters(secret_bundle_backup=backup),
             **kwargs
         )
-        return SecretProperties._from_secret_bundle(bundle)
+        restored_secret = SecretProperties._from_secret_bundle(bundle)
+        if restored_secret.name:
+            self._forget_cached(restored_secret.name)
+        return restored_secret
 
     @distributed_trace_async
     async def delete_secret(self, name: str, **kwargs: Any) -> DeletedSecret:
@@ -306,14 +486,14 @@ class SecretClient(AsyncKeyVaultClientBase):
                 :dedent: 8
         """
         polling_interval = kwargs.pop("_polling_interval", None)
-        if polling_interval is None:
-            polling_interval = 2
+        intervals = adaptive_polling_interval() if polling_interval is None else repeat(polling_interval)
         # Ignore pyright warning about return type not being iterable because we use `cls` to return a tuple
         pipeline_response, deleted_secret_bundle = await self._client.delete_secret(
             secret_name=name,
             cls=lambda pipeline_response, deserialized, _: (pipeline_response, deserialized),
             **kwargs,
         )  # pyright: ignore[reportGeneralTypeIssues]
+        self._forget_cached(name)
         deleted_secret = DeletedSecret._from_deleted_secret_bundle(deleted_secret_bundle)
 
         polling_method = AsyncDeleteRecoverPollingMethod(
@@ -322,7 +502,7 @@ class SecretClient(AsyncKeyVaultClientBase):
             command=partial(self.get_deleted_secret, name=name, **kwargs),
             final_resource=deleted_secret,
             finished=deleted_secret.recovery_id is None,
-            interval=polling_interval,
+            interval_generator=intervals,
         )
         await polling_method.run()
 
@@ -352,11 +532,18 @@ class SecretClient(AsyncKeyVaultClientBase):
         return DeletedSecret._from_deleted_secret_bundle(bundle)
 
     @distributed_trace
-    def list_deleted_secrets(self, **kwargs: Any) -> AsyncItemPaged[DeletedSecret]:
+    def list_deleted_secrets(
+        self, *, max_page_size: Optional[int] = None, prefetch_next_page: bool = False, **kwargs: Any
+    ) -> AsyncItemPaged[DeletedSecret]:
         """Lists all deleted secrets. Possible only in vaults with soft-delete enabled.
 
         Requires secrets/list permission.
 
+        :keyword int max_page_size: The maximum number of items in each page of results. The service may return fewer.
+        :keyword bool prefetch_next_page: Whether to request each next page of results while the current page is
+            being consumed, which hides the latency of page requests from callers that process items quickly. If
+            iteration stops early, one extra page may have been requested. Defaults to False.
+
         :returns: An iterator of deleted secrets, excluding their values
         :rtype: ~azure.core.async_paging.AsyncItemPaged[~azure.keyvault.secrets.DeletedSecret]
 
@@ -368,11 +555,12 @@ class SecretClient(AsyncKeyVaultClientBase):
                 :caption: Lists deleted secrets
                 :dedent: 8
         """
-        return self._client.get_deleted_secrets(
-            maxresults=kwargs.pop("max_page_size", None),
-            cls=lambda objs: [DeletedSecret._from_deleted_secret_item(x) for x in objs],
+        paged = self._client.get_deleted_secrets(
+            maxresults=max_page_size,
+            cls=_deleted_secret_items,
             **kwargs
         )
+        return _PrefetchingAsyncItemPaged(paged) if prefetch_next_page else paged
 
     @distributed_trace_async
     async def purge_deleted_secret(self, name: str, **kwargs: Any) -> None:
@@ -400,6 +588,7 @@ class SecretClient(AsyncKeyVaultClientBase):
 
         """
         await self._client.purge_deleted_secret(name, **kwargs)
+        self._forget_cached(name)
 
     @distributed_trace_async
     async def recover_deleted_secret(self, name: str, **kwargs: Any) -> SecretProperties:
@@ -425,14 +614,14 @@ class SecretClient(AsyncKeyVaultClientBase):
                 :dedent: 8
         """
         polling_interval = kwargs.pop("_polling_interval", None)
-        if polling_interval is None:
-            polling_interval = 2
+        intervals = adaptive_polling_interval() if polling_interval is None else repeat(polling_interval)
         # Ignore pyright warning about return type not being iterable because we use `cls` to return a tuple
         pipeline_response, recovered_secret_bundle = await self._client.recover_deleted_secret(
             secret_name=name,
             cls=lambda pipeline_response, deserialized, _: (pipeline_response, deserialized),
             **kwargs,
         )  # pyright: ignore[reportGeneralTypeIssues]
+        self._forget_cached(name)
         recovered_secret = SecretProperties._from_secret_bundle(recovered_secret_bundle)
 
         command = partial(self.get_secret, name=name, **kwargs)
@@ -441,7 +630,7 @@ class SecretClient(AsyncKeyVaultClientBase):
             command=command,
             final_resource=recovered_secret,
             finished=False,
-            interval=polling_interval
+            interval_generator=intervals
         )
         await polling_method.run()
 
@@ -0,0 +1,78 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import asyncio
+import os
+
+from azure.keyvault.secrets.aio import SecretClient
+from azure.identity.aio import DefaultAzureCredential
+
+# ----------------------------------------------------------------------------------------------------------
+# Prerequisites:
+# 1. An Azure Key Vault (https://learn.microsoft.com/azure/key-vault/quick-create-cli)
+#
+# 2. azure-keyvault-secrets, azure-identity, and aiohttp libraries (pip install these)
+#
+# 3. Set up your environment to use azure-identity's DefaultAzureCredential. For more information about how to configure
+#    the DefaultAzureCredential, refer to https://aka.ms/azsdk/python/identity/docs#azure.identity.DefaultAzureCredential
+#
+# ----------------------------------------------------------------------------------------------------------
+# Sample - demonstrates getting many secrets with concurrent async requests
+#
+# Key Vault has no multi-secret GET, so getting secrets one after another costs one round trip per secret. With
+# asyncio.gather the requests overlap instead; a semaphore caps the number in flight to stay within the vault's
+# service limits. Concurrent requests for the same secret version share one request, and with secret_cache_ttl set,
+# secrets fetched recently are returned without another request at all.
+#
+# 1. Create several secrets (set_secret)
+#
+# 2. Get the secrets concurrently (get_secret)
+#
+# 3. Delete the secrets (delete_secret)
+#
+# ----------------------------------------------------------------------------------------------------------
+
+MAX_CONCURRENCY = 16
+
+
+async def run_sample():
+    VAULT_URL = os.environ["VAULT_URL"]
+    credential = DefaultAzureCredential()
+    client = SecretClient(vault_url=VAULT_URL, credential=credential, secret_cache_ttl=60)
+
+    secret_names = [f"concurrentSecretName{i}" for i in range(10)]
+    print("\n.. Create several secrets")
+    for name in secret_names:
+        await client.set_secret(name, f"value of {name}")
+        print(f"Secret with name '{name}' created")
+
+    # [START get_secrets_concurrently]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def get_secret(name):
+        async with semaphore:
+            return await client.get_secret(name)
+
+    # return_exceptions=True gets every secret that can be gotten, instead of stopping at the first failure
+    results = await asyncio.gather(*(get_secret(name) for name in secret_names), return_exceptions=True)
+    # [END get_secrets_concurrently]
+
+    for name, result in zip(secret_names, results):
+        if isinstance(result, Exception):
+            print(f"Couldn't get secret '{name}': {result}")
+        else:
+            print(f"Got secret '{result.name}' with value '{result.value}'")
+
+    print("\n.. Delete the secrets")
+    for name in secret_names:
+        await client.delete_secret(name)
+        print(f"Deleted secret '{name}'")
+
+    print("\nrun_sample done")
+    await credential.close()
+    await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_sample())
@@ -0,0 +1,84 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+import asyncio
+import os
+
+import httpx
+from azure.core.experimental.transport import AsyncHttpXTransport
+from azure.identity.aio import DefaultAzureCredential
+from azure.keyvault.secrets.aio import SecretClient
+
+# ----------------------------------------------------------------------------------------------------------
+# Prerequisites:
+# 1. An Azure Key Vault (https://learn.microsoft.com/azure/key-vault/quick-create-cli)
+#
+# 2. azure-keyvault-secrets, azure-identity, azure-core-experimental, and httpx[http2] libraries (pip install these)
+#
+# 3. Set environment variable VAULT_URL with the URL of your key vault
+#
+# 4. Set up your environment to use azure-identity's DefaultAzureCredential. For more information about how to configure
+#    the DefaultAzureCredential, refer to https://aka.ms/azsdk/python/identity/docs#azure.identity.DefaultAzureCredential
+#
+# 5. Secret set, get, and delete permissions for your service principal in your vault
+#
+# ----------------------------------------------------------------------------------------------------------
+# Sample - demonstrates sharing one HTTP/2 connection pool between async SecretClients
+#
+# Each SecretClient owns its transport by default, and closing the client closes the transport's connections. An
+# application which creates a client per request or task, for example in `async with SecretClient(...)` blocks, then
+# pays for a new TLS connection every time. An httpx client with HTTP/2 enabled multiplexes concurrent requests over
+# a single connection, and transports created with client_owner=False leave that client open when a SecretClient
+# closes, so its connection is reused by every SecretClient for the life of the application.
+#
+# 1. Create one HTTP/2 httpx client for the application
+#
+# 2. Create SecretClients with transports that share it (AsyncHttpXTransport)
+#
+# 3. Set, get, and delete secrets with short-lived clients (set_secret, get_secret, delete_secret)
+#
+# 4. Close the httpx client when the application shuts down
+# ----------------------------------------------------------------------------------------------------------
+
+
+async def run_sample():
+    vault_url = os.environ["VAULT_URL"]
+    credential = DefaultAzureCredential()
+
+    # [START shared_http2_transport]
+    http_client = httpx.AsyncClient(http2=True, limits=httpx.Limits(max_connections=10, max_keepalive_connections=10))
+
+    def create_client() -> SecretClient:
+        # client_owner=False: closing the SecretClient doesn't close the shared httpx client
+        transport = AsyncHttpXTransport(client=http_client, client_owner=False)
+        return SecretClient(vault_url=vault_url, credential=credential, transport=transport)
+
+    # [END shared_http2_transport]
+
+    secret_names = [f"sharedTransportSecretName{i}" for i in range(5)]
+
+    print("\n.. Set secrets concurrently")
+    async with create_client() as client:
+        for secret in await asyncio.gather(*(client.set_secret(name, f"value of {name}") for name in secret_names)):
+            print(f"Secret with name '{secret.name}' created")
+
+    print("\n.. Get the secrets with a new client")
+    async with create_client() as client:
+        for secret in await asyncio.gather(*(client.get_secret(name) for name in secret_names)):
+            print(f"Got secret '{secret.name}' with value '{secret.value}'")
+
+    print("\n.. Delete the secrets")
+    async with create_client() as client:
+        for name in secret_names:
+            await client.delete_secret(name)
+            print(f"Deleted secret '{name}'")
+
+    # the application owns the shared httpx client, so it closes it once no SecretClient needs it
+    await http_client.aclose()
+    await credential.close()
+    print("\nrun_sample done")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_sample())
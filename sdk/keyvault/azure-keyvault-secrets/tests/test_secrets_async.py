@@ -4,14 +4,17 @@
 # ------------------------------------
 import asyncio
 import functools
+import gc
 import json
 import logging
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from azure.core.async_paging import AsyncItemPaged
 from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
 from azure.core.pipeline.policies import SansIOHTTPPolicy
 from azure.keyvault.secrets.aio import SecretClient
+from azure.keyvault.secrets._generated.models import DeletedSecretBundle, SecretBundle
 from azure.keyvault.secrets._shared.client_base import DEFAULT_VERSION
 from dateutil import parser as date_parse
 from devtools_testutils import AzureRecordedTestCase, set_custom_default_matcher
@@ -408,3 +411,222 @@ def test_custom_hook_policy():
 
     client = SecretClient("...", object(), custom_hook_policy=CustomHookPolicy())
     assert isinstance(client._client._config.custom_hook_policy, CustomHookPolicy)
+
+
+@pytest.mark.asyncio
+async def test_get_secret_cache():
+    client = SecretClient("https://vault.vault.azure.net", object(), secret_cache_ttl=60)
+    bundle = SecretBundle(
+        value="value", id="https://vault.vault.azure.net/secrets/secret-name/version", tags={"env": "test"}
+    )
+    with patch.object(client._client, "get_secret", AsyncMock(return_value=bundle)) as get_secret:
+        secret = await client.get_secret("secret-name")
+        secret.properties.tags["key"] = "value"
+        # callers get their own copies of the cached secret
+        cached = await client.get_secret("SECRET-NAME")
+        assert cached is not secret and cached.properties.tags == {"env": "test"}
+        assert get_secret.await_count == 1
+
+        # each version is cached separately
+        await client.get_secret("secret-name", "version")
+        assert get_secret.await_count == 2
+
+        # setting a secret discards its cached versions
+        with patch.object(client._client, "set_secret", AsyncMock(return_value=bundle)):
+            await client.set_secret("secret-name", "new-value")
+        assert await client.get_secret("secret-name") is not secret
+        assert get_secret.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_secret_cache_ignores_response_to_request_sent_before_set():
+    client = SecretClient("https://vault.vault.azure.net", object(), secret_cache_ttl=60)
+    old = SecretBundle(value="old", id="https://vault.vault.azure.net/secrets/secret-name/version")
+    new = SecretBundle(value="new", id="https://vault.vault.azure.net/secrets/secret-name/version")
+    release = asyncio.Event()
+
+    async def get_old_secret(*_, **__):
+        await release.wait()
+        return old
+
+    with patch.object(client._client, "get_secret", AsyncMock(side_effect=get_old_secret)):
+        in_flight = asyncio.ensure_future(client.get_secret("secret-name"))
+        await asyncio.sleep(0)
+        with patch.object(client._client, "set_secret", AsyncMock(return_value=new)):
+            await client.set_secret("secret-name", "new")
+        release.set()
+        assert (await in_flight).value == "old"
+
+    with patch.object(client._client, "get_secret", AsyncMock(return_value=new)):
+        assert (await client.get_secret("secret-name")).value == "new"
+
+
+@pytest.mark.asyncio
+async def test_get_secret_coalesces_concurrent_requests():
+    client = SecretClient("https://vault.vault.azure.net", object())
+    bundle = SecretBundle(value="value", id="https://vault.vault.azure.net/secrets/secret-name/version")
+    release = asyncio.Event()
+
+    async def get_secret(*_, **__):
+        await release.wait()
+        return bundle
+
+    with patch.object(client._client, "get_secret", AsyncMock(side_effect=get_secret)) as mock_get_secret:
+        gets = [asyncio.ensure_future(client.get_secret("secret-name")) for _ in range(3)]
+        other_version = asyncio.ensure_future(client.get_secret("secret-name", "version"))
+        await asyncio.sleep(0)
+        release.set()
+        secrets = await asyncio.gather(*gets)
+        await other_version
+        assert all(secret.value == "value" for secret in secrets)
+        assert len({id(secret) for secret in secrets}) == len(secrets)
+        assert mock_get_secret.await_count == 2
+
+        # with no request in flight, the next call sends a new one
+        await client.get_secret("secret-name")
+        assert mock_get_secret.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_secret_coalesced_request_outlives_one_cancelled_caller():
+    client = SecretClient("https://vault.vault.azure.net", object())
+    bundle = SecretBundle(value="value", id="https://vault.vault.azure.net/secrets/secret-name/version")
+    release = asyncio.Event()
+
+    async def get_secret(*_, **__):
+        await release.wait()
+        return bundle
+
+    with patch.object(client._client, "get_secret", AsyncMock(side_effect=get_secret)) as mock_get_secret:
+        cancelled = asyncio.ensure_future(client.get_secret("secret-name"))
+        waiting = asyncio.ensure_future(client.get_secret("secret-name"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        assert (await waiting).value == "value"
+        assert cancelled.cancelled()
+        assert mock_get_secret.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_secret_coalesced_request_cancelled_with_last_caller():
+    client = SecretClient("https://vault.vault.azure.net", object())
+    unhandled = []
+    asyncio.get_running_loop().set_exception_handler(lambda _, context: unhandled.append(context))
+    request_cancelled = asyncio.Event()
+
+    async def get_secret(*_, **__):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            request_cancelled.set()
+            raise
+        raise ResourceNotFoundError("secret not found")
+
+    with patch.object(client._client, "get_secret", AsyncMock(side_effect=get_secret)):
+        gets = asyncio.gather(client.get_secret("secret-name"), client.get_secret("secret-name"))
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(gets, 0.01)
+        await asyncio.wait_for(request_cancelled.wait(), 1)
+        await asyncio.sleep(0)
+    assert not client._secret_fetches
+    gc.collect()
+    assert not unhandled
+
+
+@pytest.mark.asyncio
+async def test_list_prefetch_next_page():
+    pages = {None: (["a", "b"], "page-2"), "page-2": (["c"], "page-3"), "page-3": (["d"], None)}
+    requested = []
+
+    async def get_next(continuation_token):
+        requested.append(continuation_token)
+        return pages[continuation_token]
+
+    async def extract_data(response):
+        return response[1], iter(response[0])
+
+    client = SecretClient("https://vault.vault.azure.net", object())
+    with patch.object(client._client, "get_secrets", Mock(return_value=AsyncItemPaged(get_next, extract_data))):
+        page_iterator = client.list_properties_of_secrets(prefetch_next_page=True).by_page()
+        assert [item async for item in await page_iterator.__anext__()] == ["a", "b"]
+        await asyncio.sleep(0)
+        # the second page was requested before the caller asked for it
+        assert requested == [None, "page-2"]
+        assert [[item async for item in page] async for page in page_iterator] == [["c"], ["d"]]
+        assert requested == [None, "page-2", "page-3"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("close", ("aclose", "del"))
+async def test_list_prefetch_cancelled_on_early_break(close):
+    cancelled = asyncio.Event()
+
+    async def get_next(continuation_token):
+        if continuation_token is None:
+            return ["a"], "page-2"
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def extract_data(response):
+        return response[1], iter(response[0])
+
+    client = SecretClient("https://vault.vault.azure.net", object())
+    with patch.object(client._client, "get_secrets", Mock(return_value=AsyncItemPaged(get_next, extract_data))):
+        page_iterator = client.list_properties_of_secrets(prefetch_next_page=True).by_page()
+        async for page in page_iterator:
+            assert [item async for item in page] == ["a"]
+            break
+        assert page_iterator.continuation_token == "page-2"
+        await asyncio.sleep(0)
+        if close == "aclose":
+            await page_iterator.aclose()
+        else:
+            del page_iterator
+            gc.collect()
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+
+def _deleted_secret_response(recovery_id=None):
+    """Return a fake transport, and a delete_secret response whose pipeline context holds that transport."""
+    transport = Mock(sleep=AsyncMock())
+    bundle = DeletedSecretBundle(
+        id="https://vault.vault.azure.net/secrets/secret-name/version", recovery_id=recovery_id
+    )
+    return transport, (Mock(context=Mock(transport=transport)), bundle)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "polling_interval,expected_sleeps",
+    [(None, [0.1, 0.2, 0.4, 0.8, 1.6, 2, 2]), (5, [5] * 7)],
+)
+async def test_delete_secret_polling_intervals(polling_interval, expected_sleeps):
+    client = SecretClient("https://vault.vault.azure.net", object())
+    transport, response = _deleted_secret_response("https://vault.vault.azure.net/deletedsecrets/secret-name")
+    not_found = [ResourceNotFoundError("not deleted yet")] * len(expected_sleeps)
+    kwargs = {} if polling_interval is None else {"_polling_interval": polling_interval}
+    with patch.object(client._client, "delete_secret", AsyncMock(return_value=response)), patch.object(
+        client._client, "get_deleted_secret", AsyncMock(side_effect=not_found + [response[1]])
+    ):
+        await client.delete_secret("secret-name", **kwargs)
+    assert [sleep.args[0] for sleep in transport.sleep.await_args_list] == expected_sleeps
+
+
+@pytest.mark.asyncio
+async def test_delete_secret_without_recovery_id_does_not_poll():
+    client = SecretClient("https://vault.vault.azure.net", object())
+    transport, response = _deleted_secret_response()
+    get_deleted_secret = AsyncMock()
+    with patch.object(client._client, "delete_secret", AsyncMock(return_value=response)), patch.object(
+        client._client, "get_deleted_secret", get_deleted_secret
+    ):
+        deleted_secret = await client.delete_secret("secret-name")
+    assert deleted_secret.name == "secret-name"
+    assert deleted_secret.recovery_id is None
+    assert not get_deleted_secret.called
+    assert not transport.sleep.called
@@ -12,6 +12,7 @@ import pytest
 from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
 from azure.core.pipeline.policies import SansIOHTTPPolicy
 from azure.keyvault.secrets import SecretClient
+from azure.keyvault.secrets._generated.models import DeletedSecretBundle
 from azure.keyvault.secrets._shared.client_base import DEFAULT_VERSION
 from dateutil import parser as date_parse
 from devtools_testutils import recorded_by_proxy, set_custom_default_matcher
@@ -396,3 +397,44 @@ def test_custom_hook_policy():
 
     client = SecretClient("...", object(), custom_hook_policy=CustomHookPolicy())
     assert isinstance(client._client._config.custom_hook_policy, CustomHookPolicy)
+
+
+def _deleted_secret_response(recovery_id=None):
+    """Return a fake transport, and a delete_secret response whose pipeline context holds that transport."""
+    transport = Mock()
+    bundle = DeletedSecretBundle(
+        id="https://vault.vault.azure.net/secrets/secret-name/version", recovery_id=recovery_id
+    )
+    return transport, (Mock(context=Mock(transport=transport)), bundle)
+
+
+@pytest.mark.parametrize(
+    "polling_interval,expected_sleeps",
+    [(None, [0.1, 0.2, 0.4, 0.8, 1.6, 2, 2]), (5, [5] * 7)],
+)
+def test_delete_secret_polling_intervals(polling_interval, expected_sleeps):
+    client = SecretClient("https://vault.vault.azure.net", object())
+    transport, response = _deleted_secret_response("https://vault.vault.azure.net/deletedsecrets/secret-name")
+    not_found = [ResourceNotFoundError("not deleted yet")] * len(expected_sleeps)
+    kwargs = {} if polling_interval is None else {"_polling_interval": polling_interval}
+    with patch.object(client._client, "delete_secret", Mock(return_value=response)), patch.object(
+        client._client, "get_deleted_secret", Mock(side_effect=not_found + [response[1]])
+    ):
+        client.begin_delete_secret("secret-name", **kwargs).wait()
+    assert [sleep.args[0] for sleep in transport.sleep.call_args_list] == expected_sleeps
+
+
+def test_delete_secret_without_recovery_id_does_not_poll():
+    client = SecretClient("https://vault.vault.azure.net", object())
+    transport, response = _deleted_secret_response()
+    get_deleted_secret = Mock()
+    with patch.object(client._client, "delete_secret", Mock(return_value=response)), patch.object(
+        client._client, "get_deleted_secret", get_deleted_secret
+    ):
+        poller = client.begin_delete_secret("secret-name")
+        assert poller.done()
+        deleted_secret = poller.result()
+    assert deleted_secret.name == "secret-name"
+    assert deleted_secret.recovery_id is None
+    assert not get_deleted_secret.called
+    assert not transport.sleep.called
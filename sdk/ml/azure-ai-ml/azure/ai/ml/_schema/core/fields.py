@@ -56,7 +56,25 @@ class StringTransformedEnum(Field):
         super().__init__(**kwargs)
         if isinstance(self.allowed_values, str):
             self.allowed_values = [self.allowed_values]
-        self.allowed_values = [self.casing_transform(x) for x in self.allowed_values]
+        original_values = self.allowed_values
+        self.allowed_values = [self.casing_transform(x) for x in original_values]
+        # the declared values and their transformed forms are by far the most common inputs; map them to their
+        # transformed forms up front so they don't go through casing_transform on every load and dump
+        self._transformed_values = {}
+        for value in [*original_values, *self.allowed_values]:
+            transformed = self.casing_transform(value)
+            if transformed in self.allowed_values:
+                self._transformed_values[value] = transformed
+
+    def _transform(self, value):
+        if isinstance(value, str):
+            transformed = self._transformed_values.get(value)
+            if transformed is not None:
+                return transformed
+            transformed = self.casing_transform(value)
+            if transformed in self.allowed_values:
+                return transformed
+        raise ValidationError(f"Value {value!r} passed is not in set {self.allowed_values}")
 
     def _jsonschema_type_mapping(self):
         schema = {"type": "string", "enum": self.allowed_values}
@@ -69,14 +87,12 @@ class StringTransformedEnum(Field):
     def _serialize(self, value, attr, obj, **kwargs):
         if not value:
             return None
-        if isinstance(value, str) and self.casing_transform(value) in self.allowed_values:
-            return value if self.pass_original else self.casing_transform(value)
-        raise ValidationError(f"Value {value!r} passed is not in set {self.allowed_values}")
+        transformed = self._transform(value)
+        return value if self.pass_original else transformed
 
     def _deserialize(self, value, attr, data, **kwargs):
-        if isinstance(value, str) and self.casing_transform(value) in self.allowed_values:
-            return value if self.pass_original else self.casing_transform(value)
-        raise ValidationError(f"Value {value!r} passed is not in set {self.allowed_values}")
+        transformed = self._transform(value)
+        return value if self.pass_original else transformed
 
 
 class DumpableEnumField(StringTransformedEnum):
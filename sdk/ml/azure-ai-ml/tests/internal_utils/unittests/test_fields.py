@@ -5,7 +5,7 @@ from marshmallow.exceptions import ValidationError
 from marshmallow.schema import Schema
 
 from azure.ai.ml import load_data
-from azure.ai.ml._schema import ArmStr, ArmVersionedStr
+from azure.ai.ml._schema import ArmStr, ArmVersionedStr, StringTransformedEnum
 from azure.ai.ml._scope_dependent_operations import OperationScope
 from azure.ai.ml.constants._common import (
     AZUREML_RESOURCE_PROVIDER,
@@ -36,6 +36,12 @@ class FooSchema(Schema):
     model = FooVersionedStr()
 
 
+class NetworkAccessSchema(Schema):
+    public_network_access = StringTransformedEnum(
+        allowed_values=["enabled", "disabled"], casing_transform=lambda x: x.capitalize()
+    )
+
+
 @pytest.mark.unittest
 @pytest.mark.core_sdk_test
 class TestField:
@@ -188,3 +194,13 @@ path: ./bla"""
         )
         asset = load_data(source=p)
         assert asset.version == "foobar"
+
+    def test_string_transformed_enum(self) -> None:
+        schema = NetworkAccessSchema()
+        for value in ["enabled", "Enabled", "ENABLED", "eNaBlEd"]:
+            assert schema.load({"public_network_access": value}) == {"public_network_access": "Enabled"}
+            assert schema.dump({"public_network_access": value}) == {"public_network_access": "Enabled"}
+        with pytest.raises(ValidationError):
+            schema.load({"public_network_access": "allowed"})
+        with pytest.raises(ValidationError):
+            schema.load({"public_network_access": 1})
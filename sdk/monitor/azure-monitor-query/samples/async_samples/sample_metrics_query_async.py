@@ -3,22 +3,29 @@
 """
 FILE: sample_metrics_query_async.py
 DESCRIPTION:
-    This sample demonstrates authenticating the MetricsQueryClient and retrieving the "Ingress"
-    metric along with the "Average" aggregation type. The query will execute over a timespan
-    of 2 hours with a granularity of 15 minutes.
+    This sample demonstrates authenticating the MetricsQueryClient and retrieving several metrics
+    ("Ingress", "Egress" and "Transactions" by default) along with the "Average" aggregation type.
+    The query will execute over a timespan of 2 hours with a granularity of 15 minutes.
+
+    All the metrics are requested in a single query_resource call, so the service returns them in
+    one round trip instead of one per metric.
 USAGE:
     python sample_metrics_query_async.py
     Set the environment variables with your own values before running the sample:
     1) METRICS_RESOURCE_URI - The resource URI of the resource for which the metrics are being queried.
+    2) METRIC_NAMES (optional) - Comma-separated names of the metrics to query.
+       Defaults to "Ingress,Egress,Transactions".
 
     This example uses DefaultAzureCredential, which requests a token from Azure Active Directory.
     For more information on DefaultAzureCredential, see https://learn.microsoft.com/python/api/overview/azure/identity-readme?view=azure-python#defaultazurecredential.
 
+    The credential and client are created once and shared by every query the application makes, so that access
+    tokens and connections are reused.
+
     In this example, a Storage account resource URI is taken.
 """
-import asyncio
-
 # [START send_metrics_query_async]
+import asyncio
 from datetime import timedelta
 import os
 
@@ -28,33 +35,52 @@ from azure.monitor.query.aio import MetricsQueryClient
 from azure.monitor.query import MetricAggregationType
 
 
-async def query_metrics():
-    credential = DefaultAzureCredential()
-    client = MetricsQueryClient(credential)
+# Responses with more data points than this are processed on a worker thread
+LARGE_RESPONSE_POINTS = 1000
+
 
+def print_metrics(metrics):
+    for metric in metrics:
+        print(metric.name)
+        for time_series_element in metric.timeseries:
+            for metric_value in time_series_element.data:
+                print(metric_value.timestamp)
+
+
+async def query_metrics(client, metrics_uri, metric_names):
+    try:
+        response = await client.query_resource(
+            metrics_uri,
+            metric_names=metric_names,
+            timespan=timedelta(hours=2),
+            granularity=timedelta(minutes=15),
+            aggregations=[MetricAggregationType.AVERAGE],
+        )
+
+        # Processing a long timespan at a fine granularity is a lot of synchronous work. Doing it on a worker thread
+        # keeps the event loop free to run the application's other queries in the meantime.
+        points = sum(len(ts.data) for metric in response.metrics for ts in metric.timeseries)
+        if points > LARGE_RESPONSE_POINTS:
+            await asyncio.get_running_loop().run_in_executor(None, print_metrics, response.metrics)
+        else:
+            print_metrics(response.metrics)
+    except HttpResponseError as err:
+        print("something fatal happened")
+        print(err)
+
+
+async def main():
     metrics_uri = os.environ["METRICS_RESOURCE_URI"]
-    async with client:
-        try:
-            response = await client.query_resource(
-                metrics_uri,
-                metric_names=["Ingress"],
-                timespan=timedelta(hours=2),
-                granularity=timedelta(minutes=15),
-                aggregations=[MetricAggregationType.AVERAGE],
-            )
-
-            for metric in response.metrics:
-                print(metric.name)
-                for time_series_element in metric.timeseries:
-                    for metric_value in time_series_element.data:
-                        print(metric_value.timestamp)
-        except HttpResponseError as err:
-            print("something fatal happened")
-            print(err)
-    await credential.close()
+    metric_names = os.environ.get("METRIC_NAMES", "Ingress,Egress,Transactions").split(",")
+
+    # Create the credential and client once and pass the client to every query. The credential caches its access
+    # token and the client reuses its connections, so in an application these should live as long as the
+    # application does rather than being created for each query.
+    async with DefaultAzureCredential() as credential, MetricsQueryClient(credential) as client:
+        await query_metrics(client, metrics_uri, metric_names)
 
 
 # [END send_metrics_query_async]
 
 if __name__ == "__main__":
-    asyncio.run(query_metrics())
+    asyncio.run(main())